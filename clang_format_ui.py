@@ -6,6 +6,7 @@ This application provides a visual interface for configuring clang-format
 options based on the FormatStyle struct from LLVM's Format.h.
 """
 
+import os
 import sys
 import json
 import re
@@ -15,267 +16,741 @@ import subprocess
 import threading
 import time
 import argparse
+import copy
+import functools
+import logging
+import pickle
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Any, List
 
-# Global verbose mode flag
-VERBOSE_MODE = False
+# Debug output is dropped unless logging is configured (--verbose or LOGLEVEL)
+logger = logging.getLogger(__name__)
 
-def debug_print(*args, **kwargs):
-    """Print debug message only if verbose mode is enabled."""
-    if VERBOSE_MODE:
-        print(*args, **kwargs)
+# Parsed format_style_fields.json, reused while the source file is unchanged
+FORMAT_DATA_CACHE_FILE = Path.home() / ".cache" / "clangformatui" / "fields.pkl"
+
+# Application properties set in main()
+APP_NAME = "Clang-Format UI"
+APP_VERSION = "1.0"
+APP_ORGANIZATION = "Development Tools"
 
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
+    QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QGridLayout,
     QScrollArea, QTextEdit, QSplitter, QLabel, QFrame, QCheckBox,
-    QPushButton, QGroupBox, QSpinBox, QLineEdit, QRadioButton, QButtonGroup,
+    QPushButton, QGroupBox, QSpinBox, QAbstractSpinBox, QLineEdit, QRadioButton, QButtonGroup,
     QMenuBar, QMenu, QFileDialog, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QIcon, QAction
-import re
+from PySide6.QtCore import Qt, Signal, QTimer, QSignalBlocker, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QFont, QIcon, QAction, QPalette, QColor
+
+# Number of field widgets created at once while scrolling through the options
+FIELD_WIDGET_BATCH_SIZE = 20
+
+# Widget kind for each basic field type; other types are enums or structs
+BASIC_FIELD_KINDS = {
+    'bool': 'bool',
+    'int': 'int',
+    'unsigned': 'int',
+    'std::optional<unsigned>': 'int',
+    'std::string': 'string',
+    'std::vector<std::string>': 'string',
+}
+
+# Order of the sections in the configuration panel
+FIELD_KIND_ORDER = ('bool', 'int', 'string', 'enum', 'struct')
+
+try:
+    import orjson  # Optional: C JSON parser, much faster than the json module
+except ImportError:
+    orjson = None
+
+# Application-wide style sheet, installed once in main(). Widgets select their
+# rules by class or object name so Qt parses the style sheet a single time
+# instead of once per widget.
+APP_STYLESHEET = """
+    QPushButton#info, QPushButton#enum_info, QPushButton#struct_info {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        border-radius: 15px;
+        font-size: 14px;
+    }
+    QPushButton#info:hover {
+        background-color: #2980b9;
+    }
+    QPushButton#enum_info {
+        background-color: #9b59b6;
+    }
+    QPushButton#enum_info:hover {
+        background-color: #8e44ad;
+    }
+    QPushButton#struct_info {
+        background-color: #e67e22;
+    }
+    QPushButton#struct_info:hover {
+        background-color: #d35400;
+    }
+    QPushButton#info:checked, QPushButton#enum_info:checked, QPushButton#struct_info:checked {
+        background-color: #27ae60;
+    }
+    QPushButton#info:checked:hover, QPushButton#enum_info:checked:hover, QPushButton#struct_info:checked:hover {
+        background-color: #219a52;
+    }
+    QPushButton#trash {
+        background-color: #e74c3c;
+        color: white;
+        border: none;
+        border-radius: 15px;
+        font-size: 14px;
+    }
+    QPushButton#trash:hover {
+        background-color: #c0392b;
+    }
+    QPushButton#trash:disabled {
+        background-color: #bdc3c7;
+        color: #7f8c8d;
+    }
+    QLabel#type {
+        font-size: 8px;
+        color: #6c757d;
+        font-style: italic;
+        margin-left: 5px;
+    }
+    QLabel#help {
+        font-size: 8px;
+        color: #7f8c8d;
+        font-style: italic;
+        margin-left: 20px;
+        margin-top: 2px;
+    }
+    QLabel#description, QLabel#content_description {
+        color: #2c3e50;
+        background-color: #f8f9fa;
+        padding: 8px;
+        border-radius: 4px;
+        border: 1px solid #e9ecef;
+    }
+    QLabel#description {
+        margin-left: 20px;
+    }
+    QLabel#content_description {
+        margin-bottom: 10px;
+    }
+    QCheckBox#optional {
+        font-size: 9px;
+        color: #7f8c8d;
+        margin-right: 5px;
+    }
+    QCheckBox#optional:checked {
+        color: #27ae60;
+    }
+    IntegerFieldWidget QSpinBox {
+        padding: 4px;
+        border: 1px solid #bdc3c7;
+        border-radius: 3px;
+        background-color: white;
+        font-size: 10px;
+    }
+    IntegerFieldWidget QSpinBox:focus {
+        border-color: #3498db;
+    }
+    IntegerFieldWidget QSpinBox:disabled {
+        background-color: #f8f9fa;
+        color: #6c757d;
+    }
+    StringFieldWidget QLineEdit {
+        padding: 6px;
+        border: 1px solid #bdc3c7;
+        border-radius: 3px;
+        background-color: white;
+        font-size: 10px;
+        font-family: monospace;
+    }
+    StringFieldWidget QLineEdit:focus {
+        border-color: #3498db;
+    }
+    StringFieldWidget QLineEdit:disabled {
+        background-color: #f8f9fa;
+        color: #6c757d;
+    }
+    QLabel#enum_value, QLabel#struct_status {
+        font-size: 10px;
+        color: #7f8c8d;
+        font-style: italic;
+        padding: 4px 8px;
+        background-color: #f8f9fa;
+        border: 1px solid #e9ecef;
+        border-radius: 3px;
+        min-width: 120px;
+    }
+    QLabel#enum_value[configured="true"] {
+        color: #9b59b6;
+        font-style: normal;
+        font-weight: bold;
+        background-color: #f4f1f8;
+        border-color: #9b59b6;
+    }
+    QLabel#struct_status[configured="true"] {
+        color: #e67e22;
+        font-style: normal;
+        font-weight: bold;
+        background-color: #fdf2e9;
+        border-color: #e67e22;
+    }
+    QWidget[nested="true"] {
+        background-color: #fdfdfe;
+        border: 1px solid #ecf0f1;
+        border-radius: 4px;
+        margin: 1px;
+    }
+    QWidget[nested="true"]:hover {
+        border-color: #e67e22;
+    }
+    QLabel#options_header, QLabel#fields_header {
+        color: #2c3e50;
+        margin-bottom: 5px;
+        padding-bottom: 2px;
+    }
+    QLabel#options_header {
+        border-bottom: 1px solid #9b59b6;
+    }
+    QLabel#fields_header {
+        border-bottom: 1px solid #e67e22;
+    }
+    QWidget#enum_option, QWidget#enum_option QWidget {
+        background-color: #ffffff;
+        border: 1px solid #e9ecef;
+        border-radius: 4px;
+        margin: 2px 0px;
+    }
+    QWidget#enum_option:hover, QWidget#enum_option QWidget:hover {
+        border-color: #9b59b6;
+    }
+    QWidget#enum_option QRadioButton {
+        color: #2c3e50;
+    }
+    QWidget#enum_option QRadioButton:hover {
+        color: #9b59b6;
+    }
+    QWidget#enum_option QRadioButton[selected="true"] {
+        color: #9b59b6;
+        background-color: #f4f1f8;
+        padding: 2px;
+        border-radius: 3px;
+    }
+    QWidget#enum_option QLabel#option_description {
+        color: #6c757d;
+        margin-left: 20px;
+        background-color: #fdfdfe;
+        padding: 5px;
+        border-radius: 3px;
+        border: 1px solid #e9ecef;
+    }
+    QLabel#unsupported {
+        color: #7f8c8d;
+        font-style: italic;
+        padding: 8px;
+        background-color: #f8f9fa;
+        border: 1px solid #e9ecef;
+        border-radius: 3px;
+    }
+    QLabel#section_header {
+        font-size: 14px;
+        font-weight: bold;
+        color: #2c3e50;
+        padding: 10px 5px;
+        margin-bottom: 10px;
+        margin-top: 15px;
+    }
+    QLabel#section_header[kind="bool"] {
+        border-bottom: 1px solid #3498db;
+        margin-top: 0px;
+        background-color: #ecf0f1;
+    }
+    QLabel#section_header[kind="int"] {
+        border-bottom: 1px solid #f39c12;
+        background-color: #fef9e7;
+    }
+    QLabel#section_header[kind="string"] {
+        border-bottom: 1px solid #27ae60;
+        background-color: #e8f8f5;
+    }
+    QLabel#section_header[kind="enum"] {
+        border-bottom: 1px solid #9b59b6;
+        background-color: #f4f1f8;
+    }
+    QLabel#section_header[kind="struct"] {
+        border-bottom: 1px solid #e67e22;
+        background-color: #fdf2e9;
+    }
+    QLabel#stats {
+        color: #7f8c8d;
+        font-size: 9px;
+        padding: 10px;
+        background-color: #ecf0f1;
+        border-radius: 3px;
+        margin-top: 10px;
+    }
+    QLabel#loading {
+        color: #7f8c8d;
+        font-style: italic;
+        padding: 20px;
+        text-align: center;
+    }
+    QLabel#config_title, QLabel#preview_title {
+        font-size: 16px;
+        font-weight: bold;
+        color: #2c3e50;
+        padding: 5px;
+    }
+    QLabel#config_title {
+        border-bottom: 2px solid #3498db;
+        margin-bottom: 10px;
+    }
+    QFrame#separator {
+        color: #e74c3c;
+    }
+    QTextEdit#code_editor {
+        background-color: #2b2b2b;
+        color: #ffffff;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 10px;
+        selection-background-color: #3498db;
+    }
+    QLabel#format_status {
+        font-size: 12px;
+        padding: 5px 10px;
+        border-radius: 3px;
+    }
+    QLabel#format_status[status="success"] {
+        color: #27ae60;
+        background-color: #d5f4e6;
+        border: 1px solid #27ae60;
+    }
+    QLabel#format_status[status="error"] {
+        color: #e74c3c;
+        background-color: #fdf2f2;
+        border: 1px solid #e74c3c;
+    }
+    QLabel#format_status[status="info"] {
+        color: #3498db;
+        background-color: #ebf3fd;
+        border: 1px solid #3498db;
+    }
+    QLabel#preview_info {
+        font-size: 10px;
+        color: #7f8c8d;
+        font-style: italic;
+        padding: 5px;
+        background-color: #f8f9fa;
+        border-radius: 3px;
+    }
+"""
+
+
+# Sample C++ code shown in the formatting preview
+SAMPLE_CODE = """#include <iostream>
+#include <vector>
+#include <string>
+
+namespace Example {
+    class FormatDemo {
+    public:
+        FormatDemo(int value, const std::string& name) 
+            : m_value(value), m_name(name) {}
+        
+        void processData() {
+            if (m_value > 0) {
+                std::cout << "Processing: " << m_name << std::endl;
+                
+                std::vector<int> numbers = {1, 2, 3, 4, 5};
+                for (const auto& num : numbers) {
+                    if (num % 2 == 0) {
+                        std::cout << num << " is even" << std::endl;
+                    } else {
+                        std::cout << num << " is odd" << std::endl;
+                    }
+                }
+            }
+        }
+        
+        template<typename T>
+        bool compare(const T& a, const T& b) {
+            return a < b;
+        }
+        
+    private:
+        int m_value;
+        std::string m_name;
+    };
+    
+    enum class Status {
+        Pending,
+        InProgress,
+        Completed,
+        Failed
+    };
+    
+    struct Configuration {
+        bool enableLogging = true;
+        int maxRetries = 3;
+        std::string outputPath = "/tmp/output";
+    };
+}
+
+int main() {
+    Example::FormatDemo demo(42, "Test Demo");
+    demo.processData();
+    
+    Example::Configuration config;
+    config.enableLogging = false;
+    
+    return 0;
+}"""
+
+
+@functools.lru_cache(maxsize=1)
+def get_code_font() -> QFont:
+    """Return the monospace font for the code preview.
+    
+    The font database lookups behind exactMatch() give the same answer for
+    the whole process, so the result is computed once.
+    """
+    font = QFont("Consolas", 10)
+    if not font.exactMatch():
+        font = QFont("Monaco", 10)
+    if not font.exactMatch():
+        font = QFont("Courier New", 10)
+    return font
+
+
+@functools.lru_cache(maxsize=1)
+def get_field_name_font() -> QFont:
+    """Return the bold font shared by the name label of every field widget."""
+    return QFont("Arial", 10, QFont.Bold)
+
+
+@functools.lru_cache(maxsize=1)
+def get_description_font() -> QFont:
+    """Return the font shared by the description label of every field widget."""
+    return QFont("Arial", 10)
+
+
+@functools.lru_cache(maxsize=1)
+def get_option_font() -> QFont:
+    """Return the bold font of the enum option names and the enum and struct list headers."""
+    return QFont("Arial", 9, QFont.Bold)
+
+
+@functools.lru_cache(maxsize=1)
+def get_option_description_font() -> QFont:
+    """Return the font shared by the description label of every enum option."""
+    return QFont("Arial", 8)
+
+
+@functools.lru_cache(maxsize=1)
+def get_field_palette() -> QPalette:
+    """Return the palette shared by every field widget for its white background."""
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor("#ffffff"))
+    return palette
+
+
+@functools.lru_cache(maxsize=None)
+def get_type_flags(field_type: str) -> tuple:
+    """Return the (is_vector, is_optional, is_unsigned) flags of a field type string."""
+    lowered = field_type.lower()
+    return ("vector" in lowered, "optional" in lowered, "unsigned" in lowered)
+
+
+def set_state_property(widget: QWidget, name: str, value):
+    """Set a property that APP_STYLESHEET rules select on and restyle the widget."""
+    if widget.property(name) == value:
+        return  # Already styled for this state
+    widget.setProperty(name, value)
+    # Qt only re-evaluates property selectors when the widget is polished again
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+    widget.updateGeometry()  # Padding and font may differ between states
 
 
 class DoxygenParser:
     """Parser for converting Doxygen markup to HTML for rich text display."""
     
+    # All markup is recognized by one alternation so the text is scanned once.
+    # Alternatives are tried in order at each position; bold must come before
+    # italic so that ** and __ are not taken as two empty italics. Inline code
+    # and emphasis stay within one line so they cannot swallow a code block.
+    TOKEN_PATTERN = re.compile(
+        r'(?P<version>\\version\s+(?P<version_number>[0-9]+(?:\.[0-9]+)?))'  # \version X.Y or \version X
+        r'|(?P<code_block>\\code(?:\{\.(?P<language>\w+)\})?\s*(?P<code>.*?)\\endcode)'
+        r'|\\c\s+(?P<c_command>\w+)'
+        r'|(?P<ticks>`+)(?P<backtick>[^`\n]+)(?P=ticks)'  # `code` or ``code``
+        r'|\*\*(?P<bold_star>[^\n]*?)\*\*'
+        r'|__(?P<bold_underscore>[^\n]*?)__'
+        r'|\*(?P<italic_star>[^\n]*?)\*'
+        r'|_(?P<italic_underscore>[^\n]*?)_',
+        re.DOTALL
+    )
+    
+    # Header and border color of a code block by its language
+    CODE_BLOCK_COLORS = {
+        'java': '#f39c12',
+        'cpp': '#2ecc71',
+        'c': '#2ecc71',
+        'python': '#3498db'
+    }
+    
+    # Closes the HTML opened by _code_block_head
+    CODE_BLOCK_TAIL = '''</pre>
+            </div>'''
+    
     @staticmethod
+    def has_markup(doxygen_text: str) -> bool:
+        """Return True if the text contains anything parse_to_html would convert."""
+        return any(marker in doxygen_text for marker in ('\\', '*', '_', '`'))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def parse_to_html(doxygen_text: str) -> str:
-        """Convert Doxygen markup to HTML."""
+        """Convert Doxygen markup to HTML.
+        
+        The conversion is pure, so each distinct description is only
+        converted once and later calls return the cached HTML.
+        """
         if not doxygen_text:
             return ""
         
-        html = doxygen_text
+        # Plain descriptions have no markup and only need their line breaks
+        if not DoxygenParser.has_markup(doxygen_text):
+            return doxygen_text.replace('\n', '<br>')
         
         # Handle escaped backslashes (\\code -> \code)
-        html = html.replace('\\\\', '\\')
-        
-        # Parse version tags
-        html = DoxygenParser._parse_version_tags(html)
-        
-        # Parse code blocks
-        html = DoxygenParser._parse_code_blocks(html)
+        html = doxygen_text.replace('\\\\', '\\')
         
-        # Parse inline code (backticks or \c command)
-        html = DoxygenParser._parse_inline_code(html)
+        html = DoxygenParser._parse_markup(html)
         
-        # Convert newlines to HTML breaks (preserve formatting)
-        html = html.replace('\n', '<br>')
-        
-        # Basic text formatting
-        html = DoxygenParser._parse_basic_formatting(html)
-        
-        return html
+        # Convert newlines to HTML breaks (preserve formatting). This is done
+        # with str.replace rather than as a token so that line breaks, by far
+        # the most common match, do not cost a Python callback each.
+        return html.replace('\n', '<br>')
+    
+    @staticmethod
+    def _parse_markup(text: str) -> str:
+        """Replace every markup token in a single pass over the text."""
+        return DoxygenParser.TOKEN_PATTERN.sub(DoxygenParser._replace_token, text)
     
     @staticmethod
-    def _parse_version_tags(text: str) -> str:
-        """Parse \\version tags."""
-        # Match \version X.Y or \version X
-        version_pattern = r'\\version\s+([0-9]+(?:\.[0-9]+)?)'
+    def _replace_token(match) -> str:
+        """Return the HTML for one matched markup token."""
+        kind = match.lastgroup
         
-        def replace_version(match):
-            version = match.group(1)
+        if kind == 'version':
+            version = match.group('version_number')
             return f'<div style="background-color: #e8f4f8; border-left: 4px solid #3498db; padding: 5px 10px; margin: 5px 0; font-size: 9px;"><strong>Since version {version}</strong></div>'
+        if kind == 'code_block':
+            return DoxygenParser._format_code_block(match.group('language') or 'cpp', match.group('code').strip())
+        if kind in ('c_command', 'backtick'):
+            return f'<code style="background-color: #f1f2f6; color: #2f3542; padding: 1px 4px; border-radius: 2px; font-family: monospace; font-size: 9px;">{match.group(kind)}</code>'
         
-        return re.sub(version_pattern, replace_version, text)
+        # Bold and italic text may contain further markup
+        inner = DoxygenParser._parse_markup(match.group(kind))
+        if kind in ('bold_star', 'bold_underscore'):
+            return f'<strong>{inner}</strong>'
+        return f'<em>{inner}</em>'
     
     @staticmethod
-    def _parse_code_blocks(text: str) -> str:
-        """Parse \\code...\\endcode blocks."""
-        # Match code blocks with optional language specification
-        code_pattern = r'\\code(?:\{\.(\w+)\})?\s*(.*?)\\endcode'
-        
-        def replace_code_block(match):
-            language = match.group(1) or 'cpp'
-            code_content = match.group(2).strip()
-            
-            # Clean up the code content
-            code_content = code_content.replace('<br>', '\n')
-            
-            # Language-specific styling
-            lang_color = {
-                'java': '#f39c12',
-                'cpp': '#2ecc71', 
-                'c': '#2ecc71',
-                'python': '#3498db'
-            }.get(language.lower(), '#2ecc71')
-            
-            return f'''<div style="margin: 10px 0;">
+    def _format_code_block(language: str, code_content: str) -> str:
+        """Format the contents of a \\code...\\endcode block."""
+        return DoxygenParser._code_block_head(language) + code_content + DoxygenParser.CODE_BLOCK_TAIL
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _code_block_head(language: str) -> str:
+        """Build the HTML that opens a code block, once per language."""
+        # Language-specific styling
+        lang_color = DoxygenParser.CODE_BLOCK_COLORS.get(language.lower(), '#2ecc71')
+        
+        return f'''<div style="margin: 10px 0;">
                 <div style="background-color: {lang_color}; color: white; padding: 2px 8px; font-size: 8px; font-weight: bold; border-radius: 3px 3px 0 0; display: inline-block;">
                     {language.upper()}
                 </div>
-                <pre style="background-color: #2b2b2b; color: #ffffff; padding: 10px; margin: 0; border-radius: 0 5px 5px 5px; font-family: 'Consolas', 'Monaco', 'Courier New', monospace; font-size: 9px; white-space: pre-wrap; border-left: 3px solid {lang_color};">{code_content}</pre>
-            </div>'''
-        
-        return re.sub(code_pattern, replace_code_block, text, flags=re.DOTALL)
+                <pre style="background-color: #2b2b2b; color: #ffffff; padding: 10px; margin: 0; border-radius: 0 5px 5px 5px; font-family: 'Consolas', 'Monaco', 'Courier New', monospace; font-size: 9px; white-space: pre-wrap; border-left: 3px solid {lang_color};">'''
+
+
+class FieldWidgetBase(QWidget):
+    """Base class for the field widgets.
     
-    @staticmethod
-    def _parse_inline_code(text: str) -> str:
-        """Parse inline code with \\c or backticks."""
-        # Parse \c command for inline code
-        text = re.sub(r'\\c\s+(\w+)', r'<code style="background-color: #f1f2f6; color: #2f3542; padding: 1px 4px; border-radius: 2px; font-family: monospace; font-size: 9px;">\1</code>', text)
-        
-        # Parse backticks for inline code
-        text = re.sub(r'`([^`]+)`', r'<code style="background-color: #f1f2f6; color: #2f3542; padding: 1px 4px; border-radius: 2px; font-family: monospace; font-size: 9px;">\1</code>', text)
-        
-        return text
+    Holds what every field row shares: the field name, whether the field is
+    set in the config, the info and trash buttons, and the lazily built rich
+    text description label.
+    
+    Every field widget reports edits through the same two signals, so the
+    main window and struct widgets connect each widget to one slot.
+    """
+    
+    value_changed = Signal(str, object)  # field_name, value
+    value_removed = Signal(str)  # field_name
+    
+    # No __slots__: Shiboken gives every wrapped QObject an instance __dict__
+    # (it also caches signal instances there), so slots would not remove it.
+    
+    def __init__(self, field_data: Dict[str, Any], parent=None):
+        super().__init__(parent)
+        self.field_name = field_data["name"]
+        self._description_text = field_data.get("description", "")
+        self._description_html = field_data.get("description_html")  # Rendered by FormatDataLoader
+        self.is_set = False  # Track if this field is currently set in config
+        self.description_label = None  # Built the first time it is shown
+        
+        # The background comes from a shared palette rather than style sheet
+        # rules; plain QWidget subclasses do not paint style sheet backgrounds
+        # or borders, and the :hover rules only made Qt repaint every row on
+        # mouse enter and leave.
+        self.setAutoFillBackground(True)
+        self.setPalette(get_field_palette())
+    
+    def create_name_label(self) -> QLabel:
+        """Create the bold label showing the field name."""
+        name_label = QLabel(self.field_name)
+        name_label.setFont(get_field_name_font())
+        name_label.setMinimumWidth(200)  # Ensure consistent spacing
+        return name_label
+    
+    def create_info_button(self, tool_tip: str = "Show/hide description", object_name: str = "info") -> QPushButton:
+        """Create the checkable info button that toggles the details of the field."""
+        info_button = QPushButton("ℹ")
+        info_button.setFixedSize(30, 30)
+        info_button.setToolTip(tool_tip)
+        info_button.setCheckable(True)  # Make it toggleable
+        info_button.setChecked(False)  # Initially unchecked (details hidden)
+        info_button.clicked.connect(self.on_info_clicked)
+        info_button.setObjectName(object_name)  # Styled by APP_STYLESHEET
+        return info_button
+    
+    def create_trash_button(self) -> QPushButton:
+        """Create the button that removes the field from the config."""
+        trash_button = QPushButton("🗑")
+        trash_button.setFixedSize(30, 30)
+        trash_button.setToolTip("Remove this setting")
+        trash_button.setEnabled(False)  # Initially disabled
+        trash_button.clicked.connect(self.on_trash_clicked)
+        trash_button.setObjectName("trash")  # Styled by APP_STYLESHEET
+        return trash_button
+    
+    def build_description_label(self, object_name: str = "description") -> QLabel:
+        """Create a label showing the field description."""
+        label = QLabel()
+        self.set_description_text(label, self._description_text, self._description_html)
+        label.setFont(get_description_font())
+        label.setObjectName(object_name)  # Styled by APP_STYLESHEET
+        label.setWordWrap(True)
+        label.setMaximumWidth(450)  # Slightly wider for formatted content
+        label.setOpenExternalLinks(False)  # Security: don't open external links
+        return label
     
     @staticmethod
-    def _parse_basic_formatting(text: str) -> str:
-        """Parse basic text formatting."""
-        # Bold text (**text** or __text__)
-        text = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', text)
-        text = re.sub(r'__(.*?)__', r'<strong>\1</strong>', text)
+    def set_description_text(label: QLabel, description: str, description_html: str = None):
+        """Show a description on a label, using rich text only if it has markup."""
+        if description_html is None and not DoxygenParser.has_markup(description):
+            # Plain prose does not need Qt's HTML layout engine
+            label.setTextFormat(Qt.PlainText)
+            label.setText(description)
+            return
+        label.setTextFormat(Qt.RichText)
+        label.setText(description_html or DoxygenParser.parse_to_html(description))
+    
+    def create_description_label(self):
+        """Create the description label at the bottom of the widget."""
+        self.description_label = self.build_description_label()
+        self.layout().addWidget(self.description_label)
+    
+    def on_info_clicked(self):
+        """Handle info button click to toggle description visibility."""
+        is_checked = self.info_button.isChecked()
+        if self.description_label is None:
+            if not is_checked:
+                return
+            self.create_description_label()
+        self.description_label.setVisible(is_checked)
+    
+    def on_trash_clicked(self):
+        """Handle trash button click by asking for the field to be removed."""
+        # The main window resets the widget through apply_removed_state
+        self.value_removed.emit(self.field_name)
+    
+    def update_trash_button_state(self, is_in_config: bool):
+        """Update the trash button state based on whether field is in config dictionary."""
+        self.is_set = is_in_config
+        self.trash_button.setEnabled(is_in_config)
+    
+    def is_at_default(self) -> bool:
+        """Return True if the widget already shows its default state."""
+        return False
+    
+    def apply_removed_state(self):
+        """Reset the field to its default and show it as not configured.
         
-        # Italic text (*text* or _text_)
-        text = re.sub(r'\*(.*?)\*', r'<em>\1</em>', text)
-        text = re.sub(r'_(.*?)_', r'<em>\1</em>', text)
+        Painting is suspended while the child widgets change so the row is
+        repainted once, and the widget's own signals are blocked so the reset
+        is not reported back as an edit.
+        """
+        if not self.is_set and self.is_at_default():
+            return  # Nothing to reset or repaint
         
-        return text
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self):
+                self.reset_to_default()
+                self.update_trash_button_state(False)
+        finally:
+            self.setUpdatesEnabled(True)
 
 
-class BooleanFieldWidget(QWidget):
+class BooleanFieldWidget(FieldWidgetBase):
     """Widget for boolean configuration fields."""
     
-    value_changed = Signal(str, bool)  # field_name, value
-    value_removed = Signal(str)  # field_name
-    
     def __init__(self, field_data: Dict[str, Any], parent=None):
-        super().__init__(parent)
-        self.field_name = field_data["name"]
-        self.field_data = field_data
-        self.is_set = False  # Track if this field is currently set in config
+        # Only the name and the raw description are needed after construction
+        super().__init__(field_data, parent)
         
         self.init_ui()
     
     def init_ui(self):
         """Initialize the widget UI."""
-        # Main vertical layout
-        layout = QVBoxLayout(self)
+        # A single grid holds the top row (checkbox, info and trash buttons) and,
+        # once it is built, the description spanning the row below. This needs
+        # one layout per field instead of a vertical and a nested horizontal one.
+        layout = QGridLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
-        
-        # Top row: checkbox and trash button
-        top_layout = QHBoxLayout()
+        layout.setVerticalSpacing(5)
+        layout.setColumnStretch(1, 1)  # Spacer between checkbox and buttons
         
         # Checkbox with field name
         self.checkbox = QCheckBox(self.field_name)
-        self.checkbox.setFont(QFont("Arial", 10, QFont.Bold))
-        self.checkbox.stateChanged.connect(self.on_checkbox_changed)
-        top_layout.addWidget(self.checkbox)
-        
-        # Spacer
-        top_layout.addStretch()
+        self.checkbox.setFont(get_field_name_font())
+        self.checkbox.toggled.connect(self.on_checkbox_toggled)
+        layout.addWidget(self.checkbox, 0, 0)
         
         # Info button (toggles description visibility)
-        self.info_button = QPushButton("ℹ")
-        self.info_button.setFixedSize(30, 30)
-        self.info_button.setToolTip("Show/hide description")
-        self.info_button.setCheckable(True)  # Make it toggleable
-        self.info_button.setChecked(False)  # Initially unchecked (description hidden)
-        self.info_button.clicked.connect(self.on_info_clicked)
-        self.info_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:checked {
-                background-color: #27ae60;
-            }
-            QPushButton:checked:hover {
-                background-color: #219a52;
-            }
-        """)
-        top_layout.addWidget(self.info_button)
+        self.info_button = self.create_info_button()
+        layout.addWidget(self.info_button, 0, 2)
         
         # Trash button
-        self.trash_button = QPushButton("🗑")
-        self.trash_button.setFixedSize(30, 30)
-        self.trash_button.setToolTip("Remove this setting")
-        self.trash_button.setEnabled(False)  # Initially disabled
-        self.trash_button.clicked.connect(self.on_trash_clicked)
-        self.trash_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                color: #7f8c8d;
-            }
-        """)
-        top_layout.addWidget(self.trash_button)
-        
-        layout.addLayout(top_layout)
-        
-        # Description label with rich text support
-        raw_description = self.field_data["description"]
-        formatted_description = DoxygenParser.parse_to_html(raw_description)
-        
-        self.description_label = QLabel()
-        self.description_label.setTextFormat(Qt.RichText)  # Enable rich text
-        self.description_label.setText(formatted_description)
-        self.description_label.setFont(QFont("Arial", 10))
-        self.description_label.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                margin-left: 20px;
-                background-color: #f8f9fa;
-                padding: 8px;
-                border-radius: 4px;
-                border: 1px solid #e9ecef;
-            }
-        """)
-        self.description_label.setWordWrap(True)
-        self.description_label.setMaximumWidth(450)  # Slightly wider for formatted content
-        self.description_label.setVisible(False)  # Initially hidden
-        self.description_label.setOpenExternalLinks(False)  # Security: don't open external links
-        layout.addWidget(self.description_label)
-        
-        # Style the entire widget as a box
-        self.setStyleSheet("""
-            BooleanFieldWidget {
-                background-color: #ffffff;
-                border: 1px solid #e9ecef;
-                border-radius: 8px;
-                margin: 3px 0px;
-            }
-            BooleanFieldWidget:hover {
-                border-color: #3498db;
-            }
-        """)
-    
-    def on_checkbox_changed(self, state):
-        """Handle checkbox state change."""
-        # PySide6 stateChanged emits integers: 0=Unchecked, 1=PartiallyChecked, 2=Checked
-        is_checked = state == Qt.Checked.value  # state == 2
-        debug_print(f"Checkbox state changed: state={state}, is_checked={is_checked}")
-        
-        # Always emit value_changed when checkbox changes, regardless of checked state
-        self.value_changed.emit(self.field_name, is_checked)
+        self.trash_button = self.create_trash_button()
+        layout.addWidget(self.trash_button, 0, 3)
     
-    def on_info_clicked(self):
-        """Handle info button click to toggle description visibility."""
-        is_checked = self.info_button.isChecked()
-        self.description_label.setVisible(is_checked)
+    def create_description_label(self):
+        """Create the rich text description label below the top row."""
+        self.description_label = self.build_description_label()
+        self.layout().addWidget(self.description_label, 1, 0, 1, 4)
     
-    def on_trash_clicked(self):
-        """Handle trash button click."""
-        # Don't change checkbox state, just remove from dictionary
-        self.value_removed.emit(self.field_name)
+    def on_checkbox_toggled(self, checked: bool):
+        """Handle checkbox toggle."""
+        self.value_changed.emit(self.field_name, checked)
     
     def set_value(self, value: bool):
         """Set the checkbox value programmatically."""
@@ -283,34 +758,26 @@ class BooleanFieldWidget(QWidget):
         self.is_set = value
         self.trash_button.setEnabled(value)
     
-    def update_trash_button_state(self, is_in_config: bool):
-        """Update the trash button state based on whether field is in config dictionary."""
-        self.is_set = is_in_config
-        self.trash_button.setEnabled(is_in_config)
+    def is_at_default(self) -> bool:
+        """Return True if the widget already shows its default state."""
+        return not self.checkbox.isChecked()
     
     def reset_to_default(self):
         """Reset the field to its default state (unchecked, not configured)."""
-        # Temporarily disconnect the signal to avoid triggering value_changed
-        self.checkbox.stateChanged.disconnect()
-        self.checkbox.setChecked(False)  # Default state is unchecked
-        # Reconnect the signal
-        self.checkbox.stateChanged.connect(self.on_checkbox_changed)
+        # Block the checkbox signals so the main window does not see a change
+        with QSignalBlocker(self.checkbox):
+            self.checkbox.setChecked(False)  # Default state is unchecked
 
 
-class IntegerFieldWidget(QWidget):
+class IntegerFieldWidget(FieldWidgetBase):
     """Widget for integer configuration fields (int, unsigned, std::optional<unsigned>)."""
     
-    value_changed = Signal(str, int)  # field_name, value
-    value_removed = Signal(str)  # field_name
-    
     def __init__(self, field_data: Dict[str, Any], parent=None):
-        super().__init__(parent)
-        self.field_name = field_data["name"]
-        self.field_data = field_data
+        super().__init__(field_data, parent)
         self.field_type = field_data.get("type", "int")
-        self.is_optional = "optional" in self.field_type.lower()
-        self.is_unsigned = "unsigned" in self.field_type.lower()
-        self.is_set = False  # Track if this field is currently set in config
+        self.is_optional = field_data["is_optional"]
+        self.is_unsigned = field_data["is_unsigned"]
+        self.optional_checkbox = None  # Only created for optional fields
         
         self.init_ui()
     
@@ -325,9 +792,7 @@ class IntegerFieldWidget(QWidget):
         top_layout = QHBoxLayout()
         
         # Field name label
-        self.name_label = QLabel(self.field_name)
-        self.name_label.setFont(QFont("Arial", 10, QFont.Bold))
-        self.name_label.setMinimumWidth(200)  # Ensure consistent spacing
+        self.name_label = self.create_name_label()
         top_layout.addWidget(self.name_label)
         
         # Optional checkbox (only for optional types)
@@ -336,16 +801,7 @@ class IntegerFieldWidget(QWidget):
             self.optional_checkbox.setToolTip("Enable this optional setting")
             self.optional_checkbox.setChecked(False)  # Initially disabled
             self.optional_checkbox.stateChanged.connect(self.on_optional_changed)
-            self.optional_checkbox.setStyleSheet("""
-                QCheckBox {
-                    font-size: 9px;
-                    color: #7f8c8d;
-                    margin-right: 5px;
-                }
-                QCheckBox:checked {
-                    color: #27ae60;
-                }
-            """)
+            self.optional_checkbox.setObjectName("optional")  # Styled by APP_STYLESHEET
             top_layout.addWidget(self.optional_checkbox)
         
         # Integer spin box
@@ -360,23 +816,9 @@ class IntegerFieldWidget(QWidget):
             self.spin_box.setValue(0)  # Default value
         
         self.spin_box.setFixedWidth(80)
+        # Typed numbers are reported once on Enter or focus loss, not per digit
+        self.spin_box.setKeyboardTracking(False)
         self.spin_box.valueChanged.connect(self.on_value_changed)
-        self.spin_box.setStyleSheet("""
-            QSpinBox {
-                padding: 4px;
-                border: 1px solid #bdc3c7;
-                border-radius: 3px;
-                background-color: white;
-                font-size: 10px;
-            }
-            QSpinBox:focus {
-                border-color: #3498db;
-            }
-            QSpinBox:disabled {
-                background-color: #f8f9fa;
-                color: #6c757d;
-            }
-        """)
         
         # Initially disable spin box for optional fields
         if self.is_optional:
@@ -394,108 +836,21 @@ class IntegerFieldWidget(QWidget):
             type_text += "int"
         
         self.type_label = QLabel(f"({type_text})")
-        self.type_label.setStyleSheet("""
-            QLabel {
-                font-size: 8px;
-                color: #6c757d;
-                font-style: italic;
-                margin-left: 5px;
-            }
-        """)
+        self.type_label.setObjectName("type")  # Styled by APP_STYLESHEET
         top_layout.addWidget(self.type_label)
         
         # Spacer
         top_layout.addStretch()
         
         # Info button (toggles description visibility)
-        self.info_button = QPushButton("ℹ")
-        self.info_button.setFixedSize(30, 30)
-        self.info_button.setToolTip("Show/hide description")
-        self.info_button.setCheckable(True)  # Make it toggleable
-        self.info_button.setChecked(False)  # Initially unchecked (description hidden)
-        self.info_button.clicked.connect(self.on_info_clicked)
-        self.info_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:checked {
-                background-color: #27ae60;
-            }
-            QPushButton:checked:hover {
-                background-color: #219a52;
-            }
-        """)
+        self.info_button = self.create_info_button()
         top_layout.addWidget(self.info_button)
         
         # Trash button
-        self.trash_button = QPushButton("🗑")
-        self.trash_button.setFixedSize(30, 30)
-        self.trash_button.setToolTip("Remove this setting")
-        self.trash_button.setEnabled(False)  # Initially disabled
-        self.trash_button.clicked.connect(self.on_trash_clicked)
-        self.trash_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                color: #7f8c8d;
-            }
-        """)
+        self.trash_button = self.create_trash_button()
         top_layout.addWidget(self.trash_button)
         
         layout.addLayout(top_layout)
-        
-        # Description label with rich text support
-        raw_description = self.field_data["description"]
-        formatted_description = DoxygenParser.parse_to_html(raw_description)
-        
-        self.description_label = QLabel()
-        self.description_label.setTextFormat(Qt.RichText)  # Enable rich text
-        self.description_label.setText(formatted_description)
-        self.description_label.setFont(QFont("Arial", 10))
-        self.description_label.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                margin-left: 20px;
-                background-color: #f8f9fa;
-                padding: 8px;
-                border-radius: 4px;
-                border: 1px solid #e9ecef;
-            }
-        """)
-        self.description_label.setWordWrap(True)
-        self.description_label.setMaximumWidth(450)  # Slightly wider for formatted content
-        self.description_label.setVisible(False)  # Initially hidden
-        self.description_label.setOpenExternalLinks(False)  # Security: don't open external links
-        layout.addWidget(self.description_label)
-        
-        # Style the entire widget as a box
-        self.setStyleSheet("""
-            IntegerFieldWidget {
-                background-color: #ffffff;
-                border: 1px solid #e9ecef;
-                border-radius: 8px;
-                margin: 3px 0px;
-            }
-            IntegerFieldWidget:hover {
-                border-color: #f39c12;
-            }
-        """)
     
     def on_optional_changed(self, state):
         """Handle optional checkbox state change."""
@@ -522,7 +877,7 @@ class IntegerFieldWidget(QWidget):
         should_emit = False
         
         if self.is_optional:
-            if hasattr(self, 'optional_checkbox') and self.optional_checkbox.isChecked():
+            if self.optional_checkbox is not None and self.optional_checkbox.isChecked():
                 should_emit = True
         else:
             should_emit = True
@@ -530,19 +885,9 @@ class IntegerFieldWidget(QWidget):
         if should_emit:
             self.value_changed.emit(self.field_name, value)
     
-    def on_info_clicked(self):
-        """Handle info button click to toggle description visibility."""
-        is_checked = self.info_button.isChecked()
-        self.description_label.setVisible(is_checked)
-    
-    def on_trash_clicked(self):
-        """Handle trash button click."""
-        # Remove from dictionary and reset to default
-        self.value_removed.emit(self.field_name)
-    
     def set_value(self, value: int):
         """Set the spin box value programmatically."""
-        if self.is_optional and hasattr(self, 'optional_checkbox'):
+        if self.optional_checkbox is not None:
             self.optional_checkbox.setChecked(True)
             self.spin_box.setEnabled(True)
         
@@ -550,41 +895,31 @@ class IntegerFieldWidget(QWidget):
         self.is_set = True
         self.trash_button.setEnabled(True)
     
-    def update_trash_button_state(self, is_in_config: bool):
-        """Update the trash button state based on whether field is in config dictionary."""
-        self.is_set = is_in_config
-        self.trash_button.setEnabled(is_in_config)
+    def is_at_default(self) -> bool:
+        """Return True if the widget already shows its default state."""
+        if self.optional_checkbox is not None and self.optional_checkbox.isChecked():
+            return False
+        return self.spin_box.value() == 0
     
     def reset_to_default(self):
         """Reset the field to its default state."""
-        # Temporarily disconnect signals to avoid triggering value_changed
-        self.spin_box.valueChanged.disconnect()
-        if self.is_optional and hasattr(self, 'optional_checkbox'):
-            self.optional_checkbox.stateChanged.disconnect()
-            self.optional_checkbox.setChecked(False)  # Disable optional field
+        # Block signals to avoid triggering value_changed
+        if self.optional_checkbox is not None:
+            with QSignalBlocker(self.optional_checkbox):
+                self.optional_checkbox.setChecked(False)  # Disable optional field
             self.spin_box.setEnabled(False)
         
-        self.spin_box.setValue(0)  # Default state is 0
-        
-        # Reconnect signals
-        self.spin_box.valueChanged.connect(self.on_value_changed)
-        if self.is_optional and hasattr(self, 'optional_checkbox'):
-            self.optional_checkbox.stateChanged.connect(self.on_optional_changed)
+        with QSignalBlocker(self.spin_box):
+            self.spin_box.setValue(0)  # Default state is 0
 
 
-class StringFieldWidget(QWidget):
+class StringFieldWidget(FieldWidgetBase):
     """Widget for string and vector<string> configuration fields."""
     
-    value_changed = Signal(str, object)  # field_name, value (string or list)
-    value_removed = Signal(str)  # field_name
-    
     def __init__(self, field_data: Dict[str, Any], parent=None):
-        super().__init__(parent)
-        self.field_name = field_data["name"]
-        self.field_data = field_data
+        super().__init__(field_data, parent)
         self.field_type = field_data.get("type", "std::string")
-        self.is_vector = "vector" in self.field_type.lower()
-        self.is_set = False  # Track if this field is currently set in config
+        self.is_vector = field_data["is_vector"]
         
         self.init_ui()
     
@@ -599,9 +934,7 @@ class StringFieldWidget(QWidget):
         top_layout = QHBoxLayout()
         
         # Field name label
-        self.name_label = QLabel(self.field_name)
-        self.name_label.setFont(QFont("Arial", 10, QFont.Bold))
-        self.name_label.setMinimumWidth(200)  # Ensure consistent spacing
+        self.name_label = self.create_name_label()
         top_layout.addWidget(self.name_label)
         
         # String input field
@@ -611,91 +944,24 @@ class StringFieldWidget(QWidget):
             else "Enter string value..."
         )
         self.line_edit.textChanged.connect(self.on_text_changed)
-        self.line_edit.setStyleSheet("""
-            QLineEdit {
-                padding: 6px;
-                border: 1px solid #bdc3c7;
-                border-radius: 3px;
-                background-color: white;
-                font-size: 10px;
-                font-family: monospace;
-            }
-            QLineEdit:focus {
-                border-color: #3498db;
-            }
-            QLineEdit:disabled {
-                background-color: #f8f9fa;
-                color: #6c757d;
-            }
-        """)
         top_layout.addWidget(self.line_edit)
         
         # Type indicator label
         type_text = "vector<string>" if self.is_vector else "string"
         
         self.type_label = QLabel(f"({type_text})")
-        self.type_label.setStyleSheet("""
-            QLabel {
-                font-size: 8px;
-                color: #6c757d;
-                font-style: italic;
-                margin-left: 5px;
-            }
-        """)
+        self.type_label.setObjectName("type")  # Styled by APP_STYLESHEET
         top_layout.addWidget(self.type_label)
         
         # Spacer
         top_layout.addStretch()
         
         # Info button (toggles description visibility)
-        self.info_button = QPushButton("ℹ")
-        self.info_button.setFixedSize(30, 30)
-        self.info_button.setToolTip("Show/hide description")
-        self.info_button.setCheckable(True)  # Make it toggleable
-        self.info_button.setChecked(False)  # Initially unchecked (description hidden)
-        self.info_button.clicked.connect(self.on_info_clicked)
-        self.info_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:checked {
-                background-color: #27ae60;
-            }
-            QPushButton:checked:hover {
-                background-color: #219a52;
-            }
-        """)
+        self.info_button = self.create_info_button()
         top_layout.addWidget(self.info_button)
         
         # Trash button
-        self.trash_button = QPushButton("🗑")
-        self.trash_button.setFixedSize(30, 30)
-        self.trash_button.setToolTip("Remove this setting")
-        self.trash_button.setEnabled(False)  # Initially disabled
-        self.trash_button.clicked.connect(self.on_trash_clicked)
-        self.trash_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                color: #7f8c8d;
-            }
-        """)
+        self.trash_button = self.create_trash_button()
         top_layout.addWidget(self.trash_button)
         
         layout.addLayout(top_layout)
@@ -703,53 +969,8 @@ class StringFieldWidget(QWidget):
         # Help text for vector fields
         if self.is_vector:
             help_label = QLabel("💡 Separate multiple values with commas (e.g., value1, value2, value3)")
-            help_label.setStyleSheet("""
-                QLabel {
-                    font-size: 8px;
-                    color: #7f8c8d;
-                    font-style: italic;
-                    margin-left: 20px;
-                    margin-top: 2px;
-                }
-            """)
+            help_label.setObjectName("help")  # Styled by APP_STYLESHEET
             layout.addWidget(help_label)
-        
-        # Description label with rich text support
-        raw_description = self.field_data["description"]
-        formatted_description = DoxygenParser.parse_to_html(raw_description)
-        
-        self.description_label = QLabel()
-        self.description_label.setTextFormat(Qt.RichText)  # Enable rich text
-        self.description_label.setText(formatted_description)
-        self.description_label.setFont(QFont("Arial", 10))
-        self.description_label.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                margin-left: 20px;
-                background-color: #f8f9fa;
-                padding: 8px;
-                border-radius: 4px;
-                border: 1px solid #e9ecef;
-            }
-        """)
-        self.description_label.setWordWrap(True)
-        self.description_label.setMaximumWidth(450)  # Slightly wider for formatted content
-        self.description_label.setVisible(False)  # Initially hidden
-        self.description_label.setOpenExternalLinks(False)  # Security: don't open external links
-        layout.addWidget(self.description_label)
-        
-        # Style the entire widget as a box
-        self.setStyleSheet("""
-            StringFieldWidget {
-                background-color: #ffffff;
-                border: 1px solid #e9ecef;
-                border-radius: 8px;
-                margin: 3px 0px;
-            }
-            StringFieldWidget:hover {
-                border-color: #27ae60;
-            }
-        """)
     
     def on_text_changed(self, text):
         """Handle text input change."""
@@ -767,11 +988,6 @@ class StringFieldWidget(QWidget):
             # Empty text means remove the field
             self.value_removed.emit(self.field_name)
     
-    def on_info_clicked(self):
-        """Handle info button click to toggle description visibility."""
-        is_checked = self.info_button.isChecked()
-        self.description_label.setVisible(is_checked)
-    
     def on_trash_clicked(self):
         """Handle trash button click."""
         # Clear the input and remove from config
@@ -791,39 +1007,34 @@ class StringFieldWidget(QWidget):
         self.is_set = bool(text.strip())
         self.trash_button.setEnabled(self.is_set)
     
-    def update_trash_button_state(self, is_in_config: bool):
-        """Update the trash button state based on whether field is in config dictionary."""
-        self.is_set = is_in_config
-        self.trash_button.setEnabled(is_in_config)
+    def is_at_default(self) -> bool:
+        """Return True if the widget already shows its default state."""
+        return not self.line_edit.text()
     
     def reset_to_default(self):
         """Reset the field to its default state."""
-        # Temporarily disconnect the signal to avoid triggering value_changed
-        self.line_edit.textChanged.disconnect()
-        self.line_edit.clear()  # Default state is empty
-        # Reconnect the signal
-        self.line_edit.textChanged.connect(self.on_text_changed)
+        # Block the signal to avoid triggering value_changed
+        with QSignalBlocker(self.line_edit):
+            self.line_edit.clear()  # Default state is empty
 
 
-class EnumFieldWidget(QWidget):
+class EnumFieldWidget(FieldWidgetBase):
     """Widget for enum configuration fields."""
     
-    value_changed = Signal(str, str)  # field_name, enum_value
-    value_removed = Signal(str)  # field_name
-    
     def __init__(self, field_data: Dict[str, Any], enum_data: Dict[str, Any], parent=None):
-        super().__init__(parent)
-        self.field_name = field_data["name"]
-        self.field_data = field_data
+        super().__init__(field_data, parent)
         self.enum_type = field_data.get("type", "")
         self.enum_values = enum_data.get(self.enum_type, [])
+        self.enum_names_by_yaml = None  # YAML value -> enum name, built on first use
+        self.enum_names = None  # Names of all enum values, built with enum_names_by_yaml
         self.selected_value = None
-        self.is_set = False
         self.is_expanded = False  # Track if enum options are visible
         
         # Radio button group for enum values
         self.button_group = QButtonGroup()
+        self.button_group.idToggled.connect(self.on_option_toggled)  # One connection for all options
         self.radio_buttons = []
+        self.radio_button_by_name = {}  # Enum name -> radio button, filled with the options
         
         self.init_ui()
     
@@ -838,136 +1049,54 @@ class EnumFieldWidget(QWidget):
         top_layout = QHBoxLayout()
         
         # Field name label
-        self.name_label = QLabel(self.field_name)
-        self.name_label.setFont(QFont("Arial", 10, QFont.Bold))
-        self.name_label.setMinimumWidth(200)  # Ensure consistent spacing
+        self.name_label = self.create_name_label()
         top_layout.addWidget(self.name_label)
         
         # Current value label
         self.value_label = QLabel("(no selection)")
-        self.value_label.setStyleSheet("""
-            QLabel {
-                font-size: 10px;
-                color: #7f8c8d;
-                font-style: italic;
-                padding: 4px 8px;
-                background-color: #f8f9fa;
-                border: 1px solid #e9ecef;
-                border-radius: 3px;
-                min-width: 120px;
-            }
-        """)
+        self.value_label.setObjectName("enum_value")  # Styled by APP_STYLESHEET
+        self.value_label.setProperty("configured", False)
         top_layout.addWidget(self.value_label)
         
         # Type indicator label
         self.type_label = QLabel(f"({self.enum_type})")
-        self.type_label.setStyleSheet("""
-            QLabel {
-                font-size: 8px;
-                color: #6c757d;
-                font-style: italic;
-                margin-left: 5px;
-            }
-        """)
+        self.type_label.setObjectName("type")  # Styled by APP_STYLESHEET
         top_layout.addWidget(self.type_label)
         
         # Spacer
         top_layout.addStretch()
         
         # Info button (toggles description and enum options visibility)
-        self.info_button = QPushButton("ℹ")
-        self.info_button.setFixedSize(30, 30)
-        self.info_button.setToolTip("Show/hide enum options and description")
-        self.info_button.setCheckable(True)  # Make it toggleable
-        self.info_button.setChecked(False)  # Initially unchecked (options hidden)
-        self.info_button.clicked.connect(self.on_info_clicked)
-        self.info_button.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #8e44ad;
-            }
-            QPushButton:checked {
-                background-color: #27ae60;
-            }
-            QPushButton:checked:hover {
-                background-color: #219a52;
-            }
-        """)
+        self.info_button = self.create_info_button("Show/hide enum options and description", "enum_info")
         top_layout.addWidget(self.info_button)
         
         # Trash button
-        self.trash_button = QPushButton("🗑")
-        self.trash_button.setFixedSize(30, 30)
-        self.trash_button.setToolTip("Remove this setting")
-        self.trash_button.setEnabled(False)  # Initially disabled
-        self.trash_button.clicked.connect(self.on_trash_clicked)
-        self.trash_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                color: #7f8c8d;
-            }
-        """)
+        self.trash_button = self.create_trash_button()
         top_layout.addWidget(self.trash_button)
         
         layout.addLayout(top_layout)
         
-        # Container for enum description and options (initially hidden)
+        # The description and option radio buttons are only built the first
+        # time the enum is expanded; until then only selected_value is kept
+        self.content_widget = None
+    
+    def create_content_widget(self):
+        """Create the container with the enum description and option radio buttons."""
+        # Container for enum description and options
         self.content_widget = QWidget()
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(10, 10, 10, 10)
         self.content_layout.setSpacing(8)
         
         # Enum description (field description)
-        if self.field_data.get("description"):
-            raw_description = self.field_data["description"]
-            formatted_description = DoxygenParser.parse_to_html(raw_description)
-            
-            self.description_label = QLabel()
-            self.description_label.setTextFormat(Qt.RichText)
-            self.description_label.setText(formatted_description)
-            self.description_label.setFont(QFont("Arial", 10))
-            self.description_label.setStyleSheet("""
-                QLabel {
-                    color: #2c3e50;
-                    background-color: #f8f9fa;
-                    padding: 8px;
-                    border-radius: 4px;
-                    border: 1px solid #e9ecef;
-                    margin-bottom: 10px;
-                }
-            """)
-            self.description_label.setWordWrap(True)
-            self.description_label.setMaximumWidth(450)
-            self.description_label.setOpenExternalLinks(False)
+        if self._description_text:
+            self.description_label = self.build_description_label("content_description")
             self.content_layout.addWidget(self.description_label)
         
         # Enum options section
         options_header = QLabel(f"Available Options ({len(self.enum_values)} values):")
-        options_header.setFont(QFont("Arial", 9, QFont.Bold))
-        options_header.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                margin-bottom: 5px;
-                border-bottom: 1px solid #9b59b6;
-                padding-bottom: 2px;
-            }
-        """)
+        options_header.setFont(get_option_font())
+        options_header.setObjectName("options_header")
         self.content_layout.addWidget(options_header)
         
         # Create radio buttons for each enum value
@@ -977,81 +1106,41 @@ class EnumFieldWidget(QWidget):
             
             # Container for each option
             option_widget = QWidget()
+            option_widget.setObjectName("enum_option")
             option_layout = QVBoxLayout(option_widget)
             option_layout.setContentsMargins(5, 5, 5, 5)
             option_layout.setSpacing(3)
             
             # Radio button with enum value name
             radio_button = QRadioButton(value_name)
-            radio_button.setFont(QFont("Arial", 9, QFont.Bold))
-            radio_button.toggled.connect(lambda checked, name=value_name: self.on_option_selected(checked, name))
-            radio_button.setStyleSheet("""
-                QRadioButton {
-                    color: #2c3e50;
-                }
-                QRadioButton:checked {
-                    color: #9b59b6;
-                    font-weight: bold;
-                }
-            """)
+            radio_button.setProperty("selected", False)  # Styled by APP_STYLESHEET
+            radio_button.setFont(get_option_font())
             self.radio_buttons.append(radio_button)
+            self.radio_button_by_name[value_name] = radio_button
             self.button_group.addButton(radio_button, i)
             option_layout.addWidget(radio_button)
             
             # Description for this enum value
             if value_description:
-                formatted_description = DoxygenParser.parse_to_html(value_description)
-                
                 desc_label = QLabel()
-                desc_label.setTextFormat(Qt.RichText)
-                desc_label.setText(formatted_description)
-                desc_label.setFont(QFont("Arial", 8))
-                desc_label.setStyleSheet("""
-                    QLabel {
-                        color: #6c757d;
-                        margin-left: 20px;
-                        background-color: #fdfdfe;
-                        padding: 5px;
-                        border-radius: 3px;
-                        border: 1px solid #e9ecef;
-                    }
-                """)
+                self.set_description_text(desc_label, value_description, enum_value.get("description_html"))
+                desc_label.setFont(get_option_description_font())
+                desc_label.setObjectName("option_description")
                 desc_label.setWordWrap(True)
                 desc_label.setMaximumWidth(400)
                 desc_label.setOpenExternalLinks(False)
                 option_layout.addWidget(desc_label)
             
-            # Style the option widget
-            option_widget.setStyleSheet("""
-                QWidget {
-                    background-color: #ffffff;
-                    border: 1px solid #e9ecef;
-                    border-radius: 4px;
-                    margin: 2px 0px;
-                }
-                QWidget:hover {
-                    border-color: #9b59b6;
-                }
-            """)
-            
             self.content_layout.addWidget(option_widget)
         
-        # Initially hide the content widget
-        self.content_widget.setVisible(False)
-        layout.addWidget(self.content_widget)
-        
-        # Style the entire widget as a box
-        self.setStyleSheet("""
-            EnumFieldWidget {
-                background-color: #ffffff;
-                border: 1px solid #e9ecef;
-                border-radius: 8px;
-                margin: 3px 0px;
-            }
-            EnumFieldWidget:hover {
-                border-color: #9b59b6;
-            }
-        """)
+        # Show the value that was selected before the radio buttons existed
+        radio_button = self.radio_button_by_name.get(self.selected_value)
+        if radio_button is not None:
+            with QSignalBlocker(self.button_group):
+                radio_button.setChecked(True)
+        self.update_radio_button_styles()
+        
+        self.layout().addWidget(self.content_widget)
     
     def convert_enum_to_yaml_value(self, enum_name: str) -> str:
         """Convert enum name (e.g., 'BOS_None') to YAML value (e.g., 'None')."""
@@ -1062,31 +1151,36 @@ class EnumFieldWidget(QWidget):
     
     def convert_yaml_value_to_enum(self, yaml_value: str) -> str:
         """Convert YAML value (e.g., 'None') to enum name (e.g., 'BOS_None')."""
-        # Find the enum that matches the YAML value
-        for enum_value in self.enum_values:
-            enum_name = enum_value.get("name", "")
-            if self.convert_enum_to_yaml_value(enum_name) == yaml_value:
-                return enum_name
+        if not isinstance(yaml_value, str):
+            return yaml_value  # Cannot match any enum name
+        
         # If no match found, return the original value
-        return yaml_value
+        return self.get_enum_names_by_yaml().get(yaml_value, yaml_value)
+    
+    def get_enum_names_by_yaml(self) -> Dict[str, str]:
+        """Return the mapping from YAML value to enum name, building it on first use."""
+        # The enum values never change, so map them once; the first enum
+        # with a given YAML value wins, as in a linear search
+        if self.enum_names_by_yaml is None:
+            self.enum_names_by_yaml = {}
+            self.enum_names = set()
+            for enum_value in self.enum_values:
+                enum_name = enum_value.get("name", "")
+                self.enum_names.add(enum_name)
+                self.enum_names_by_yaml.setdefault(self.convert_enum_to_yaml_value(enum_name), enum_name)
+        return self.enum_names_by_yaml
+    
+    def on_option_toggled(self, button_id: int, checked: bool):
+        """Handle a radio button of the group being checked or unchecked."""
+        # Button ids are the indices of the enum values
+        self.on_option_selected(checked, self.enum_values[button_id].get("name", ""))
     
     def on_option_selected(self, checked: bool, value_name: str):
         """Handle when an enum option is selected."""
         if checked:  # Only handle when option is selected (not deselected)
             self.selected_value = value_name
             self.value_label.setText(value_name)
-            self.value_label.setStyleSheet("""
-                QLabel {
-                    font-size: 10px;
-                    color: #9b59b6;
-                    font-weight: bold;
-                    padding: 4px 8px;
-                    background-color: #f4f1f8;
-                    border: 1px solid #9b59b6;
-                    border-radius: 3px;
-                    min-width: 120px;
-                }
-            """)
+            set_state_property(self.value_label, "configured", True)
             
             # Convert enum name to YAML value and emit the change
             yaml_value = self.convert_enum_to_yaml_value(value_name)
@@ -1097,131 +1191,75 @@ class EnumFieldWidget(QWidget):
     
     def update_radio_button_styles(self):
         """Update radio button styles to highlight the selected one."""
+        # A property rather than :checked, so the selected button's padding
+        # is included in its size hint
         for radio_button in self.radio_buttons:
-            if radio_button.isChecked():
-                radio_button.setStyleSheet("""
-                    QRadioButton {
-                        color: #9b59b6;
-                        font-weight: bold;
-                        background-color: #f4f1f8;
-                        padding: 2px;
-                        border-radius: 3px;
-                    }
-                """)
-            else:
-                radio_button.setStyleSheet("""
-                    QRadioButton {
-                        color: #2c3e50;
-                    }
-                    QRadioButton:hover {
-                        color: #9b59b6;
-                    }
-                """)
+            set_state_property(radio_button, "selected", radio_button.isChecked())
     
     def on_info_clicked(self):
         """Handle info button click to toggle options visibility."""
         self.is_expanded = self.info_button.isChecked()
+        if self.content_widget is None:
+            if not self.is_expanded:
+                return
+            self.create_content_widget()
         self.content_widget.setVisible(self.is_expanded)
     
     def on_trash_clicked(self):
         """Handle trash button click."""
         # Clear selection and remove from config
-        self.button_group.setExclusive(False)  # Temporarily allow no selection
-        for radio_button in self.radio_buttons:
-            radio_button.setChecked(False)
-        self.button_group.setExclusive(True)  # Restore exclusive selection
-        
-        self.selected_value = None
-        self.value_label.setText("(no selection)")
-        self.value_label.setStyleSheet("""
-            QLabel {
-                font-size: 10px;
-                color: #7f8c8d;
-                font-style: italic;
-                padding: 4px 8px;
-                background-color: #f8f9fa;
-                border: 1px solid #e9ecef;
-                border-radius: 3px;
-                min-width: 120px;
-            }
-        """)
-        
-        self.update_radio_button_styles()
+        self.reset_to_default()
         self.value_removed.emit(self.field_name)
     
     def set_value(self, value: str):
         """Set the enum value programmatically."""
         # Convert YAML value to enum name for UI display
         enum_name = self.convert_yaml_value_to_enum(value)
-        
-        for radio_button in self.radio_buttons:
-            if radio_button.text() == enum_name:
-                radio_button.setChecked(True)
-                self.selected_value = enum_name
-                self.value_label.setText(enum_name)
-                self.value_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 10px;
-                        color: #9b59b6;
-                        font-weight: bold;
-                        padding: 4px 8px;
-                        background-color: #f4f1f8;
-                        border: 1px solid #9b59b6;
-                        border-radius: 3px;
-                        min-width: 120px;
-                    }
-                """)
-                self.is_set = True
-                self.trash_button.setEnabled(True)
-                self.update_radio_button_styles()
-                break
+        # Converting a string builds enum_names along with the YAML lookup
+        if not isinstance(enum_name, str) or enum_name not in self.enum_names:
+            return  # Not one of this enum's values
+        
+        radio_button = self.radio_button_by_name.get(enum_name)
+        if radio_button is not None:  # Only once the options are built
+            radio_button.setChecked(True)
+        self.selected_value = enum_name
+        self.value_label.setText(enum_name)
+        set_state_property(self.value_label, "configured", True)
+        self.is_set = True
+        self.trash_button.setEnabled(True)
+        self.update_radio_button_styles()
     
-    def update_trash_button_state(self, is_in_config: bool):
-        """Update the trash button state based on whether field is in config dictionary."""
-        self.is_set = is_in_config
-        self.trash_button.setEnabled(is_in_config)
+    def is_at_default(self) -> bool:
+        """Return True if the widget already shows its default state."""
+        return self.selected_value is None
     
     def reset_to_default(self):
         """Reset the field to its default state."""
-        # Clear all radio button selections
-        self.button_group.setExclusive(False)
-        for radio_button in self.radio_buttons:
-            radio_button.setChecked(False)
-        self.button_group.setExclusive(True)
+        # Only the checked button has to be cleared; blocking the group's
+        # signals keeps the deselection from being handled as an edit
+        checked_button = self.button_group.checkedButton()
+        if checked_button is not None:
+            self.button_group.setExclusive(False)  # Temporarily allow no selection
+            with QSignalBlocker(self.button_group):
+                checked_button.setChecked(False)
+            self.button_group.setExclusive(True)  # Restore exclusive selection
+            set_state_property(checked_button, "selected", False)
         
         self.selected_value = None
         self.value_label.setText("(no selection)")
-        self.value_label.setStyleSheet("""
-            QLabel {
-                font-size: 10px;
-                color: #7f8c8d;
-                font-style: italic;
-                padding: 4px 8px;
-                background-color: #f8f9fa;
-                border: 1px solid #e9ecef;
-                border-radius: 3px;
-                min-width: 120px;
-            }
-        """)
-        self.update_radio_button_styles()
+        set_state_property(self.value_label, "configured", False)
 
 
-class StructFieldWidget(QWidget):
+class StructFieldWidget(FieldWidgetBase):
     """Widget for custom struct configuration fields."""
     
-    value_changed = Signal(str, dict)  # field_name, struct_dict
-    value_removed = Signal(str)  # field_name
-    
     def __init__(self, field_data: Dict[str, Any], struct_data: Dict[str, Any], format_data: Dict[str, Any], parent=None):
-        super().__init__(parent)
-        self.field_name = field_data["name"]
-        self.field_data = field_data
+        super().__init__(field_data, parent)
         self.struct_type = field_data.get("type", "")
         self.struct_definition = struct_data.get(self.struct_type, {})
         self.struct_fields = self.struct_definition.get("fields", [])
         self.format_data = format_data  # Full format data for nested lookups
         self.selected_values = {}  # Track selected values for each field
-        self.is_set = False
         self.is_expanded = False  # Track if struct options are visible
         
         # Track nested field widgets
@@ -1240,158 +1278,67 @@ class StructFieldWidget(QWidget):
         top_layout = QHBoxLayout()
         
         # Field name label
-        self.name_label = QLabel(self.field_name)
-        self.name_label.setFont(QFont("Arial", 10, QFont.Bold))
-        self.name_label.setMinimumWidth(200)  # Ensure consistent spacing
+        self.name_label = self.create_name_label()
         top_layout.addWidget(self.name_label)
         
         # Current status label
         self.status_label = QLabel(f"({len(self.selected_values)} of {len(self.struct_fields)} set)")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                font-size: 10px;
-                color: #7f8c8d;
-                font-style: italic;
-                padding: 4px 8px;
-                background-color: #f8f9fa;
-                border: 1px solid #e9ecef;
-                border-radius: 3px;
-                min-width: 120px;
-            }
-        """)
+        self.status_label.setObjectName("struct_status")  # Styled by APP_STYLESHEET
+        self.status_label.setProperty("configured", False)
         top_layout.addWidget(self.status_label)
         
         # Type indicator label
         self.type_label = QLabel(f"({self.struct_type})")
-        self.type_label.setStyleSheet("""
-            QLabel {
-                font-size: 8px;
-                color: #6c757d;
-                font-style: italic;
-                margin-left: 5px;
-            }
-        """)
+        self.type_label.setObjectName("type")  # Styled by APP_STYLESHEET
         top_layout.addWidget(self.type_label)
         
         # Spacer
         top_layout.addStretch()
         
         # Info button (toggles description and struct fields visibility)
-        self.info_button = QPushButton("ℹ")
-        self.info_button.setFixedSize(30, 30)
-        self.info_button.setToolTip("Show/hide struct fields and description")
-        self.info_button.setCheckable(True)  # Make it toggleable
-        self.info_button.setChecked(False)  # Initially unchecked (fields hidden)
-        self.info_button.clicked.connect(self.on_info_clicked)
-        self.info_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e67e22;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #d35400;
-            }
-            QPushButton:checked {
-                background-color: #27ae60;
-            }
-            QPushButton:checked:hover {
-                background-color: #219a52;
-            }
-        """)
+        self.info_button = self.create_info_button("Show/hide struct fields and description", "struct_info")
         top_layout.addWidget(self.info_button)
         
         # Trash button
-        self.trash_button = QPushButton("🗑")
-        self.trash_button.setFixedSize(30, 30)
-        self.trash_button.setToolTip("Remove this setting")
-        self.trash_button.setEnabled(False)  # Initially disabled
-        self.trash_button.clicked.connect(self.on_trash_clicked)
-        self.trash_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                color: #7f8c8d;
-            }
-        """)
+        self.trash_button = self.create_trash_button()
         top_layout.addWidget(self.trash_button)
         
         layout.addLayout(top_layout)
         
-        # Container for struct description and fields (initially hidden)
+        # The description and nested field widgets are only built the first
+        # time the struct is expanded; until then only selected_values is kept
+        self.content_widget = None
+    
+    def create_content_widget(self):
+        """Create the container with the struct description and nested field widgets."""
+        # Container for struct description and fields
         self.content_widget = QWidget()
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(10, 10, 10, 10)
         self.content_layout.setSpacing(8)
         
         # Struct description (field description)
-        if self.field_data.get("description"):
-            raw_description = self.field_data["description"]
-            formatted_description = DoxygenParser.parse_to_html(raw_description)
-            
-            self.description_label = QLabel()
-            self.description_label.setTextFormat(Qt.RichText)
-            self.description_label.setText(formatted_description)
-            self.description_label.setFont(QFont("Arial", 10))
-            self.description_label.setStyleSheet("""
-                QLabel {
-                    color: #2c3e50;
-                    background-color: #f8f9fa;
-                    padding: 8px;
-                    border-radius: 4px;
-                    border: 1px solid #e9ecef;
-                    margin-bottom: 10px;
-                }
-            """)
-            self.description_label.setWordWrap(True)
-            self.description_label.setMaximumWidth(450)
-            self.description_label.setOpenExternalLinks(False)
+        if self._description_text:
+            self.description_label = self.build_description_label("content_description")
             self.content_layout.addWidget(self.description_label)
         
         # Struct fields section
         fields_header = QLabel(f"Struct Fields ({len(self.struct_fields)} fields):")
-        fields_header.setFont(QFont("Arial", 9, QFont.Bold))
-        fields_header.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                margin-bottom: 5px;
-                border-bottom: 1px solid #e67e22;
-                padding-bottom: 2px;
-            }
-        """)
+        fields_header.setFont(get_option_font())
+        fields_header.setObjectName("fields_header")
         self.content_layout.addWidget(fields_header)
         
         # Create nested widgets for each struct field in definition order
         for struct_field in self.struct_fields:
             self.create_nested_field_widget(struct_field)
         
-        # Initially hide the content widget
-        self.content_widget.setVisible(False)
-        layout.addWidget(self.content_widget)
-        
-        # Style the entire widget as a box
-        self.setStyleSheet("""
-            StructFieldWidget {
-                background-color: #ffffff;
-                border: 1px solid #e9ecef;
-                border-radius: 8px;
-                margin: 3px 0px;
-            }
-            StructFieldWidget:hover {
-                border-color: #e67e22;
-            }
-        """)
+        # Show the values that were set before the nested widgets existed
+        for widget in self.nested_widgets:
+            if widget.field_name in self.selected_values:
+                with QSignalBlocker(widget):
+                    widget.set_value(self.selected_values[widget.field_name])
+        
+        self.layout().addWidget(self.content_widget)
     
     def create_nested_field_widget(self, struct_field: Dict[str, Any]):
         """Create a nested widget for a struct field."""
@@ -1409,38 +1356,21 @@ class StructFieldWidget(QWidget):
         
         if field_type == "bool":
             widget = BooleanFieldWidget(struct_field)
-            widget.value_changed.connect(lambda name, value: self.on_nested_value_changed(name, value))
-            widget.value_removed.connect(lambda name: self.on_nested_value_removed(name))
         elif field_type in ['int', 'unsigned', 'std::optional<unsigned>']:
             widget = IntegerFieldWidget(struct_field)
-            widget.value_changed.connect(lambda name, value: self.on_nested_value_changed(name, value))
-            widget.value_removed.connect(lambda name: self.on_nested_value_removed(name))
         elif field_type in ['std::string', 'std::vector<std::string>']:
             widget = StringFieldWidget(struct_field)
-            widget.value_changed.connect(lambda name, value: self.on_nested_value_changed(name, value))
-            widget.value_removed.connect(lambda name: self.on_nested_value_removed(name))
         elif field_type in self.format_data.get('enum_definitions', {}):
             widget = EnumFieldWidget(struct_field, self.format_data.get('enum_definitions', {}))
-            widget.value_changed.connect(lambda name, value: self.on_nested_value_changed(name, value))
-            widget.value_removed.connect(lambda name: self.on_nested_value_removed(name))
         elif field_type in self.format_data.get('struct_definitions', {}):
             widget = StructFieldWidget(struct_field, self.format_data.get('struct_definitions', {}), self.format_data)
-            widget.value_changed.connect(lambda name, value: self.on_nested_value_changed(name, value))
-            widget.value_removed.connect(lambda name: self.on_nested_value_removed(name))
         
         if widget:
-            # Style the nested widget with slightly different appearance
-            widget.setStyleSheet("""
-                QWidget {
-                    background-color: #fdfdfe;
-                    border: 1px solid #ecf0f1;
-                    border-radius: 4px;
-                    margin: 1px;
-                }
-                QWidget:hover {
-                    border-color: #e67e22;
-                }
-            """)
+            widget.value_changed.connect(self.on_nested_value_changed)
+            widget.value_removed.connect(self.on_nested_value_removed)
+            
+            # Nested widgets get a slightly different appearance from APP_STYLESHEET
+            widget.setProperty("nested", True)
             
             field_layout.addWidget(widget)
             self.nested_widgets.append(widget)
@@ -1448,16 +1378,7 @@ class StructFieldWidget(QWidget):
         else:
             # For unsupported field types, show a placeholder
             placeholder_label = QLabel(f"{field_name}: {field_type} (unsupported)")
-            placeholder_label.setStyleSheet("""
-                QLabel {
-                    color: #7f8c8d;
-                    font-style: italic;
-                    padding: 8px;
-                    background-color: #f8f9fa;
-                    border: 1px solid #e9ecef;
-                    border-radius: 3px;
-                }
-            """)
+            placeholder_label.setObjectName("unsupported")
             field_layout.addWidget(placeholder_label)
             self.content_layout.addWidget(field_container)
     
@@ -1466,9 +1387,10 @@ class StructFieldWidget(QWidget):
         self.selected_values[field_name] = value
         self.update_status()
         
-        # Emit the struct change with current values
+        # Emit the struct change with current values; receivers must not
+        # modify the dict and copy it if they keep it past this change
         if self.selected_values:
-            self.value_changed.emit(self.field_name, dict(self.selected_values))
+            self.value_changed.emit(self.field_name, self.selected_values)
     
     def on_nested_value_removed(self, field_name: str):
         """Handle when a nested field value is removed."""
@@ -1479,7 +1401,7 @@ class StructFieldWidget(QWidget):
         
         # Emit struct change or removal
         if self.selected_values:
-            self.value_changed.emit(self.field_name, dict(self.selected_values))
+            self.value_changed.emit(self.field_name, self.selected_values)
         else:
             self.value_removed.emit(self.field_name)
     
@@ -1491,39 +1413,21 @@ class StructFieldWidget(QWidget):
         self.status_label.setText(f"({count} of {total} set)")
         
         if count > 0:
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    font-size: 10px;
-                    color: #e67e22;
-                    font-weight: bold;
-                    padding: 4px 8px;
-                    background-color: #fdf2e9;
-                    border: 1px solid #e67e22;
-                    border-radius: 3px;
-                    min-width: 120px;
-                }
-            """)
+            set_state_property(self.status_label, "configured", True)
             self.trash_button.setEnabled(True)
             self.is_set = True
         else:
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    font-size: 10px;
-                    color: #7f8c8d;
-                    font-style: italic;
-                    padding: 4px 8px;
-                    background-color: #f8f9fa;
-                    border: 1px solid #e9ecef;
-                    border-radius: 3px;
-                    min-width: 120px;
-                }
-            """)
+            set_state_property(self.status_label, "configured", False)
             self.trash_button.setEnabled(False)
             self.is_set = False
     
     def on_info_clicked(self):
         """Handle info button click to toggle fields visibility."""
         self.is_expanded = self.info_button.isChecked()
+        if self.content_widget is None:
+            if not self.is_expanded:
+                return
+            self.create_content_widget()
         self.content_widget.setVisible(self.is_expanded)
     
     def on_trash_clicked(self):
@@ -1560,6 +1464,10 @@ class StructFieldWidget(QWidget):
             if not self.selected_values:  # Only disable if no nested values
                 self.trash_button.setEnabled(False)
     
+    def is_at_default(self) -> bool:
+        """Return True if the widget already shows its default state."""
+        return not self.selected_values
+    
     def reset_to_default(self):
         """Reset the field to its default state."""
         self.selected_values.clear()
@@ -1571,6 +1479,104 @@ class StructFieldWidget(QWidget):
         self.update_status()
 
 
+class FormatDataLoader(QRunnable):
+    """Reads and parses format_style_fields.json on a QThreadPool worker thread."""
+    
+    class Signals(QObject):
+        """Signals of the loader; they are delivered to the GUI thread as queued calls."""
+        loaded = Signal(object)  # parsed format data dict
+        failed = Signal(str)  # error message
+    
+    def __init__(self, json_file: Path):
+        super().__init__()
+        self.json_file = json_file
+        self.signals = FormatDataLoader.Signals()
+    
+    def run(self):
+        """Parse the file and report the result to the GUI thread."""
+        # Any error, including data of the wrong shape, must reach the GUI
+        # thread; an exception escaping run() only prints a thread traceback
+        try:
+            stat = self.json_file.stat()
+            cache_key = (str(self.json_file.resolve()), stat.st_mtime_ns, stat.st_size)
+            format_data = self.read_cache(cache_key)
+            if format_data is None:
+                # Both parsers accept UTF-8 bytes directly, skipping a text decode pass
+                raw_data = self.json_file.read_bytes()
+                if orjson is not None:
+                    format_data = orjson.loads(raw_data)
+                else:
+                    # Fallback when orjson is not installed
+                    format_data = json.loads(raw_data)
+                self.write_cache(cache_key, format_data)
+            
+            # Field names key config_values and the widget lookup, so share one string object per name
+            for field in format_data.get('fields', []):
+                if 'name' in field:
+                    field['name'] = sys.intern(field['name'])
+            
+            self.annotate_field_types(format_data)
+            self.render_descriptions(format_data)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        
+        self.signals.loaded.emit(format_data)
+    
+    def annotate_field_types(self, format_data: Dict[str, Any]):
+        """Store the is_vector, is_optional and is_unsigned flags of every field's type.
+        
+        The field widgets read the flags instead of inspecting the type string
+        each time one is built, so every field that reaches a widget, nested
+        struct fields included, must pass through here first.
+        """
+        fields = list(format_data.get('fields', []))
+        for struct_def in format_data.get('struct_definitions', {}).values():
+            fields.extend(struct_def.get('fields', []))
+        
+        for field in fields:
+            field['is_vector'], field['is_optional'], field['is_unsigned'] = get_type_flags(field.get('type', ''))
+    
+    def render_descriptions(self, format_data: Dict[str, Any]):
+        """Convert every Doxygen description to HTML while still off the GUI thread.
+        
+        The result is stored as 'description_html' next to the description, so
+        the widgets only have to set it on their labels. Descriptions without
+        markup get no HTML and are shown as plain text.
+        """
+        items = list(format_data.get('fields', []))
+        for struct_def in format_data.get('struct_definitions', {}).values():
+            items.extend(struct_def.get('fields', []))
+        for enum_values in format_data.get('enum_definitions', {}).values():
+            items.extend(enum_values)
+        
+        for item in items:
+            description = item.get('description')
+            if description and DoxygenParser.has_markup(description):
+                item['description_html'] = DoxygenParser.parse_to_html(description)
+        
+        logger.debug("Description HTML cache: %s", DoxygenParser.parse_to_html.cache_info())
+    
+    def read_cache(self, cache_key: tuple):
+        """Return the cached format data if it was built from the same file, else None."""
+        try:
+            with open(FORMAT_DATA_CACHE_FILE, 'rb') as f:
+                stored_key, format_data = pickle.load(f)
+        except Exception:
+            # Missing, stale or unreadable cache; fall back to parsing the JSON
+            return None
+        return format_data if stored_key == cache_key else None
+    
+    def write_cache(self, cache_key: tuple, format_data: Dict[str, Any]):
+        """Store the parsed format data for the next launch."""
+        try:
+            FORMAT_DATA_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(FORMAT_DATA_CACHE_FILE, 'wb') as f:
+                pickle.dump((cache_key, format_data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError) as e:
+            logger.debug("Could not write format data cache: %s", e)
+
+
 class ClangFormatUI(QMainWindow):
     """Main window for the Clang-Format UI application."""
     
@@ -1578,11 +1584,17 @@ class ClangFormatUI(QMainWindow):
         super().__init__()
         self.format_data: Dict[str, Any] = {}
         self.config_values: Dict[str, Any] = {}  # Store current configuration values
-        self.field_widgets: List[QWidget] = []  # Track created widgets (both boolean and integer)
+        self.field_widgets: Dict[str, QWidget] = {}  # Created field widgets by field name, in build order
+        self.field_kinds: Dict[str, str] = {}  # Field kind for every top-level field, built or not
+        self.pending_rows: deque = deque()  # (kind, field) rows not yet turned into widgets
+        self.stats_text: str = ""  # Statistics shown once all rows are built
         self.current_file_path: str = ""  # Track currently loaded file
         self.is_modified: bool = False  # Track if current config has unsaved changes
         self.is_quitting: bool = False  # Track if we're in the quit process
         self.clang_format_binary: str = clang_format_binary  # Path to clang-format binary
+        self.format_data_loader = None  # Background loader while format data is being parsed
+        self.pending_changes: Dict[str, Any] = {}  # Changes from field widgets not yet applied to config_values
+        self.flush_scheduled: bool = False  # Whether a zero-delay flush of pending_changes is queued
         
         # Timer for debouncing format updates
         self.format_timer = QTimer()
@@ -1590,6 +1602,13 @@ class ClangFormatUI(QMainWindow):
         self.format_timer.timeout.connect(self.format_code_preview)
         self.format_timer.setInterval(500)  # 500ms delay
         
+        # Timer for debouncing string and struct edits, so typing (also in a
+        # nested field of a struct) applies only the last keystroke
+        self.edit_timer = QTimer()
+        self.edit_timer.setSingleShot(True)
+        self.edit_timer.timeout.connect(self.flush_pending_changes)
+        self.edit_timer.setInterval(200)  # 200ms delay
+        
         self.init_ui()
         self.load_format_data()
         # Initial formatting
@@ -1639,16 +1658,7 @@ class ClangFormatUI(QMainWindow):
         
         # Title for left column
         title_label = QLabel("Clang-Format Configuration Options")
-        title_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 5px;
-                border-bottom: 2px solid #3498db;
-                margin-bottom: 10px;
-            }
-        """)
+        title_label.setObjectName("config_title")  # Styled by APP_STYLESHEET
         left_layout.addWidget(title_label)
         
         # Scroll area for configuration options
@@ -1656,6 +1666,12 @@ class ClangFormatUI(QMainWindow):
         scroll_area.setWidgetResizable(True)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.config_scroll_area = scroll_area
+        
+        # Build more field widgets as the user scrolls towards the end of the list
+        scroll_bar = scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.on_config_scrolled)
+        scroll_bar.rangeChanged.connect(self.on_config_scrolled)
         
         # Widget to contain the configuration options
         self.config_widget = QWidget()
@@ -1674,14 +1690,7 @@ class ClangFormatUI(QMainWindow):
     def create_placeholder_content(self):
         """Create placeholder content before format data is loaded."""
         placeholder_label = QLabel("Loading configuration options...")
-        placeholder_label.setStyleSheet("""
-            QLabel {
-                color: #7f8c8d;
-                font-style: italic;
-                padding: 20px;
-                text-align: center;
-            }
-        """)
+        placeholder_label.setObjectName("loading")
         self.config_layout.addWidget(placeholder_label)
         
         # Add stretch to push content to top
@@ -1704,28 +1713,13 @@ class ClangFormatUI(QMainWindow):
         
         # Title for right column
         title_label = QLabel("C++ Code Preview")
-        title_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 5px;
-            }
-        """)
+        title_label.setObjectName("preview_title")  # Styled by APP_STYLESHEET
         header_layout.addWidget(title_label)
         
         # Status label for formatting feedback
         self.format_status_label = QLabel("Ready")
-        self.format_status_label.setStyleSheet("""
-            QLabel {
-                font-size: 12px;
-                color: #27ae60;
-                padding: 5px 10px;
-                background-color: #d5f4e6;
-                border-radius: 3px;
-                border: 1px solid #27ae60;
-            }
-        """)
+        self.format_status_label.setObjectName("format_status")  # Styled by APP_STYLESHEET
+        self.format_status_label.setProperty("status", "success")
         header_layout.addStretch()
         header_layout.addWidget(self.format_status_label)
         
@@ -1735,7 +1729,7 @@ class ClangFormatUI(QMainWindow):
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
         separator.setFrameShadow(QFrame.Sunken)
-        separator.setStyleSheet("color: #e74c3c;")
+        separator.setObjectName("separator")
         right_layout.addWidget(separator)
         
         # Text editor for code preview
@@ -1743,103 +1737,23 @@ class ClangFormatUI(QMainWindow):
         self.code_editor.setPlainText(self.get_sample_code())
         
         # Set monospace font for code
-        font = QFont("Consolas", 10)
-        if not font.exactMatch():
-            font = QFont("Monaco", 10)
-        if not font.exactMatch():
-            font = QFont("Courier New", 10)
-        self.code_editor.setFont(font)
+        self.code_editor.setFont(get_code_font())
         
         # Style the code editor
-        self.code_editor.setStyleSheet("""
-            QTextEdit {
-                background-color: #2b2b2b;
-                color: #ffffff;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 10px;
-                selection-background-color: #3498db;
-            }
-        """)
+        self.code_editor.setObjectName("code_editor")
         
         right_layout.addWidget(self.code_editor)
         
         # Info label
         info_label = QLabel("💡 Code preview updates automatically as you change formatting options")
-        info_label.setStyleSheet("""
-            QLabel {
-                font-size: 10px;
-                color: #7f8c8d;
-                font-style: italic;
-                padding: 5px;
-                background-color: #f8f9fa;
-                border-radius: 3px;
-            }
-        """)
+        info_label.setObjectName("preview_info")
         right_layout.addWidget(info_label)
         
         parent.addWidget(right_frame)
         
     def get_sample_code(self) -> str:
         """Return sample C++ code for formatting preview."""
-        return """#include <iostream>
-#include <vector>
-#include <string>
-
-namespace Example {
-    class FormatDemo {
-    public:
-        FormatDemo(int value, const std::string& name) 
-            : m_value(value), m_name(name) {}
-        
-        void processData() {
-            if (m_value > 0) {
-                std::cout << "Processing: " << m_name << std::endl;
-                
-                std::vector<int> numbers = {1, 2, 3, 4, 5};
-                for (const auto& num : numbers) {
-                    if (num % 2 == 0) {
-                        std::cout << num << " is even" << std::endl;
-                    } else {
-                        std::cout << num << " is odd" << std::endl;
-                    }
-                }
-            }
-        }
-        
-        template<typename T>
-        bool compare(const T& a, const T& b) {
-            return a < b;
-        }
-        
-    private:
-        int m_value;
-        std::string m_name;
-    };
-    
-    enum class Status {
-        Pending,
-        InProgress,
-        Completed,
-        Failed
-    };
-    
-    struct Configuration {
-        bool enableLogging = true;
-        int maxRetries = 3;
-        std::string outputPath = "/tmp/output";
-    };
-}
-
-int main() {
-    Example::FormatDemo demo(42, "Test Demo");
-    demo.processData();
-    
-    Example::Configuration config;
-    config.enableLogging = false;
-    
-    return 0;
-}"""
+        return SAMPLE_CODE
     
     def create_menu_bar(self):
         """Create the menu bar with File menu."""
@@ -1905,270 +1819,205 @@ int main() {
         tools_menu.addAction(test_binary_action)
         
     def load_format_data(self):
-        """Load format style data from JSON file."""
+        """Start loading format style data from the JSON file in the background."""
         json_file = Path("format_style_fields.json")
         
         if not json_file.exists():
-            print(f"Warning: {json_file} not found. UI will show placeholder content.")
+            logger.warning("%s not found. UI will show placeholder content.", json_file)
             return
-            
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                self.format_data = json.load(f)
-            debug_print(f"Loaded {len(self.format_data.get('fields', []))} format options")
-            
-            # Create UI elements from format_data
-            self.create_config_widgets()
-            
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading format data: {e}")
+        
+        # Parse on a worker thread so the window can paint the placeholder right away
+        self.format_data_loader = FormatDataLoader(json_file)
+        self.format_data_loader.signals.loaded.connect(self.on_format_data_loaded)
+        self.format_data_loader.signals.failed.connect(self.on_format_data_failed)
+        QThreadPool.globalInstance().start(self.format_data_loader)
+    
+    def on_format_data_loaded(self, format_data: Dict[str, Any]):
+        """Create the configuration widgets once the format data has been parsed."""
+        self.format_data = format_data
+        self.format_data_loader = None
+        logger.debug("Loaded %s format options", len(self.format_data.get('fields', [])))
+        
+        # Create UI elements from format_data
+        self.create_config_widgets()
+    
+    def on_format_data_failed(self, message: str):
+        """Report a format data file that could not be read or parsed."""
+        self.format_data_loader = None
+        logger.error("Error loading format data: %s", message)
     
     def create_config_widgets(self):
         """Create widgets for configuration options based on loaded data."""
         # Clear existing content
         self.clear_layout(self.config_layout)
         
-        # Filter fields by type
-        boolean_fields = [
-            field for field in self.format_data.get('fields', [])
-            if field.get('type') == 'bool'
-        ]
-        
-        integer_fields = [
-            field for field in self.format_data.get('fields', [])
-            if field.get('type') in ['int', 'unsigned', 'std::optional<unsigned>']
-        ]
-        
-        string_fields = [
-            field for field in self.format_data.get('fields', [])
-            if field.get('type') in ['std::string', 'std::vector<std::string>']
-        ]
-        
-        # Get list of known basic types
-        basic_types = {'bool', 'int', 'unsigned', 'std::optional<unsigned>', 'std::string', 'std::vector<std::string>'}
-        
-        enum_fields = [
-            field for field in self.format_data.get('fields', [])
-            if field.get('type') not in basic_types and field.get('type') in self.format_data.get('enum_definitions', {})
-        ]
-        
-        struct_fields = [
-            field for field in self.format_data.get('fields', [])
-            if field.get('type') not in basic_types and field.get('type') in self.format_data.get('struct_definitions', {})
-        ]
-        
-        debug_print(f"Creating widgets for {len(boolean_fields)} boolean fields, {len(integer_fields)} integer fields, {len(string_fields)} string fields, {len(enum_fields)} enum fields, and {len(struct_fields)} struct fields")
-        
-        # Create boolean section
-        if boolean_fields:
-            boolean_header = QLabel(f"Boolean Options ({len(boolean_fields)} fields)")
-            boolean_header.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    font-weight: bold;
-                    color: #2c3e50;
-                    padding: 10px 5px;
-                    border-bottom: 1px solid #3498db;
-                    margin-bottom: 10px;
-                    background-color: #ecf0f1;
-                }
-            """)
-            self.config_layout.addWidget(boolean_header)
-            
-            # Create widgets for each boolean field
-            for field in boolean_fields:
-                widget = BooleanFieldWidget(field)
-                widget.value_changed.connect(self.on_boolean_value_changed)
-                widget.value_removed.connect(self.on_field_value_removed)
-                self.field_widgets.append(widget)
-                self.config_layout.addWidget(widget)
-        
-        # Create integer section
-        if integer_fields:
-            integer_header = QLabel(f"Integer Options ({len(integer_fields)} fields)")
-            integer_header.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    font-weight: bold;
-                    color: #2c3e50;
-                    padding: 10px 5px;
-                    border-bottom: 1px solid #f39c12;
-                    margin-bottom: 10px;
-                    margin-top: 15px;
-                    background-color: #fef9e7;
-                }
-            """)
-            self.config_layout.addWidget(integer_header)
-            
-            # Create widgets for each integer field
-            for field in integer_fields:
-                widget = IntegerFieldWidget(field)
-                widget.value_changed.connect(self.on_integer_value_changed)
-                widget.value_removed.connect(self.on_field_value_removed)
-                self.field_widgets.append(widget)
-                self.config_layout.addWidget(widget)
-        
-        # Create string section
-        if string_fields:
-            string_header = QLabel(f"String Options ({len(string_fields)} fields)")
-            string_header.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    font-weight: bold;
-                    color: #2c3e50;
-                    padding: 10px 5px;
-                    border-bottom: 1px solid #27ae60;
-                    margin-bottom: 10px;
-                    margin-top: 15px;
-                    background-color: #e8f8f5;
-                }
-            """)
-            self.config_layout.addWidget(string_header)
-            
-            # Create widgets for each string field
-            for field in string_fields:
-                widget = StringFieldWidget(field)
-                widget.value_changed.connect(self.on_string_value_changed)
-                widget.value_removed.connect(self.on_field_value_removed)
-                self.field_widgets.append(widget)
-                self.config_layout.addWidget(widget)
-        
-        # Create enum section
-        if enum_fields:
-            enum_header = QLabel(f"Enum Options ({len(enum_fields)} fields)")
-            enum_header.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    font-weight: bold;
-                    color: #2c3e50;
-                    padding: 10px 5px;
-                    border-bottom: 1px solid #9b59b6;
-                    margin-bottom: 10px;
-                    margin-top: 15px;
-                    background-color: #f4f1f8;
-                }
-            """)
-            self.config_layout.addWidget(enum_header)
-            
-            # Create widgets for each enum field
-            for field in enum_fields:
-                widget = EnumFieldWidget(field, self.format_data.get('enum_definitions', {}))
-                widget.value_changed.connect(self.on_enum_value_changed)
-                widget.value_removed.connect(self.on_field_value_removed)
-                self.field_widgets.append(widget)
-                self.config_layout.addWidget(widget)
-        
-        # Create struct section
-        if struct_fields:
-            struct_header = QLabel(f"Struct Options ({len(struct_fields)} fields)")
-            struct_header.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    font-weight: bold;
-                    color: #2c3e50;
-                    padding: 10px 5px;
-                    border-bottom: 1px solid #e67e22;
-                    margin-bottom: 10px;
-                    margin-top: 15px;
-                    background-color: #fdf2e9;
-                }
-            """)
-            self.config_layout.addWidget(struct_header)
-            
-            # Create widgets for each struct field
-            for field in struct_fields:
-                widget = StructFieldWidget(field, self.format_data.get('struct_definitions', {}), self.format_data)
-                widget.value_changed.connect(self.on_struct_value_changed)
-                widget.value_removed.connect(self.on_field_value_removed)
-                self.field_widgets.append(widget)
-                self.config_layout.addWidget(widget)
-        
-        # Add stretch to push content to top
+        # Sort fields by kind in a single pass, keeping their order within each kind
+        enum_definitions = self.format_data.get('enum_definitions', {})
+        struct_definitions = self.format_data.get('struct_definitions', {})
+        fields_by_kind: Dict[str, List[Dict[str, Any]]] = {kind: [] for kind in FIELD_KIND_ORDER}
+        for field in self.format_data.get('fields', []):
+            field_type = field.get('type')
+            kind = BASIC_FIELD_KINDS.get(field_type)
+            if kind is None:
+                if field_type in enum_definitions:
+                    kind = 'enum'
+                elif field_type in struct_definitions:
+                    kind = 'struct'
+                else:
+                    continue  # Unsupported type, only counted in the statistics
+            fields_by_kind[kind].append(field)
+        
+        counts = {kind: len(fields) for kind, fields in fields_by_kind.items()}
+        logger.debug("Creating widgets for %s boolean fields, %s integer fields, %s string fields, %s enum fields, and %s struct fields", counts['bool'], counts['int'], counts['string'], counts['enum'], counts['struct'])
+        
+        # Queue one header row per section followed by its fields. Widgets are
+        # only built once they are about to be scrolled into view.
+        self.field_widgets.clear()  # Their widgets were just deleted with the layout
+        self.field_kinds.clear()
+        self.pending_rows.clear()
+        for kind, fields in fields_by_kind.items():
+            if fields:
+                self.pending_rows.append((kind, len(fields)))
+                for field in fields:
+                    self.field_kinds[field['name']] = kind
+                    self.pending_rows.append((kind, field))
+        
+        # Add stretch to push content to top; rows are inserted before it
         self.config_layout.addStretch()
         
-        # Show some statistics
+        # Statistics are shown below the stretch once every row has been built
         total_fields = len(self.format_data.get('fields', []))
-        other_fields = total_fields - len(boolean_fields) - len(integer_fields) - len(string_fields) - len(enum_fields) - len(struct_fields)
-        
-        stats_label = QLabel(f"Total fields: {total_fields}\n"
-                           f"Boolean fields: {len(boolean_fields)}\n"
-                           f"Integer fields: {len(integer_fields)}\n"
-                           f"String fields: {len(string_fields)}\n"
-                           f"Enum fields: {len(enum_fields)}\n"
-                           f"Struct fields: {len(struct_fields)}\n"
+        other_fields = total_fields - sum(counts.values())
+        
+        self.stats_text = (f"Total fields: {total_fields}\n"
+                           f"Boolean fields: {counts['bool']}\n"
+                           f"Integer fields: {counts['int']}\n"
+                           f"String fields: {counts['string']}\n"
+                           f"Enum fields: {counts['enum']}\n"
+                           f"Struct fields: {counts['struct']}\n"
                            f"Other types: {other_fields}")
-        stats_label.setStyleSheet("""
-            QLabel {
-                color: #7f8c8d;
-                font-size: 9px;
-                padding: 10px;
-                background-color: #ecf0f1;
-                border-radius: 3px;
-                margin-top: 10px;
-            }
-        """)
-        self.config_layout.addWidget(stats_label)
+        
+        # Build the first screen of widgets right away
+        self.build_pending_rows(FIELD_WIDGET_BATCH_SIZE)
+    
+    def create_section_header(self, kind: str, count: int) -> QLabel:
+        """Create the header label shown above a section of fields."""
+        title = {
+            'bool': "Boolean Options",
+            'int': "Integer Options",
+            'string': "String Options",
+            'enum': "Enum Options",
+            'struct': "Struct Options",
+        }[kind]
+        
+        # Colors come from the section_header rules in APP_STYLESHEET
+        header = QLabel(f"{title} ({count} fields)", self.config_widget)
+        header.setObjectName("section_header")
+        header.setProperty("kind", kind)
+        return header
+    
+    def create_field_widget(self, kind: str, field: Dict[str, Any]) -> QWidget:
+        """Create and connect the widget for a top-level field."""
+        # Widgets are created inside the config panel so that inserting them
+        # into its layout does not reparent and restyle them a second time
+        parent = self.config_widget
+        if kind == 'bool':
+            widget = BooleanFieldWidget(field, parent)
+        elif kind == 'int':
+            widget = IntegerFieldWidget(field, parent)
+        elif kind == 'string':
+            widget = StringFieldWidget(field, parent)
+        elif kind == 'enum':
+            widget = EnumFieldWidget(field, self.format_data.get('enum_definitions', {}), parent)
+        else:
+            widget = StructFieldWidget(field, self.format_data.get('struct_definitions', {}), self.format_data, parent)
+        widget.value_changed.connect(self.on_field_value_changed)
+        widget.value_removed.connect(self.on_field_value_removed)
+        self.field_widgets[field['name']] = widget
+        
+        # Restore the value of fields that were configured before the widget existed
+        field_name = field['name']
+        if field_name in self.config_values:
+            with QSignalBlocker(widget):
+                widget.set_value(self.config_values[field_name])
+            widget.update_trash_button_state(True)
+        
+        return widget
+    
+    def build_pending_rows(self, count: int):
+        """Build the next `count` queued rows in display order."""
+        # Suspend painting while the batch is inserted so the container is
+        # repainted once instead of after every addWidget
+        with self.bulk_update():
+            built = 0
+            while self.pending_rows and built < count:
+                kind, row = self.pending_rows.popleft()
+                if isinstance(row, dict):
+                    row_widget = self.create_field_widget(kind, row)
+                else:
+                    row_widget = self.create_section_header(kind, row)
+                # Insert before the trailing stretch
+                self.config_layout.insertWidget(self.config_layout.count() - 1, row_widget)
+                built += 1
+        
+        if not self.pending_rows and self.stats_text:
+            stats_label = QLabel(self.stats_text)
+            stats_label.setObjectName("stats")
+            self.config_layout.addWidget(stats_label)
+            self.stats_text = ""
+    
+    @contextmanager
+    def bulk_update(self):
+        """Suspend painting of the config panel while many rows change.
+        
+        The panel is repainted once when the block ends.
+        """
+        self.config_widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.config_widget.setUpdatesEnabled(True)
+    
+    def on_config_scrolled(self, *args):
+        """Build the next batch of rows when the view gets close to the end of the list."""
+        if not self.pending_rows:
+            return
+        scroll_bar = self.config_scroll_area.verticalScrollBar()
+        if scroll_bar.value() >= scroll_bar.maximum() - scroll_bar.pageStep():
+            self.build_pending_rows(FIELD_WIDGET_BATCH_SIZE)
     
     def clear_layout(self, layout):
         """Clear all widgets from a layout."""
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        # Take items from the back so the remaining ones never shift down
+        for i in reversed(range(layout.count())):
+            item = layout.takeAt(i)
+            widget = item.widget()
+            if widget is not None:
+                widget.setParent(None)
+                widget.deleteLater()
     
     def on_field_value_changed(self, field_name: str, value):
-        """Handle when a field value is changed (for boolean fields - keeping for compatibility)."""
-        # Always add to config dictionary when value changes
-        self.config_values[field_name] = value
-        
-        # Update trash button state for this field
-        widget = self.get_field_widget(field_name)
-        if widget:
-            widget.update_trash_button_state(True)  # Field is now in config
-        
-        print(f"Set {field_name} = {value}")
-        print(f"Current config has {len(self.config_values)} values")
-    
-    def on_boolean_value_changed(self, field_name: str, value: bool):
-        """Handle when a boolean field value is changed."""
-        # Always add to config dictionary when checkbox changes
-        self.config_values[field_name] = value
-        debug_print(f"Set boolean {field_name} = {value}")
-        debug_print(f"Current config has {len(self.config_values)} values")
-        
-        # Update trash button state for this field
-        widget = self.get_field_widget(field_name)
-        if widget:
-            widget.update_trash_button_state(True)  # Field is now in config
-        
-        # Mark as modified
-        self.mark_as_modified()
-        
-        # Schedule format update
-        self.schedule_format_update()
-    
-    def on_integer_value_changed(self, field_name: str, value: int):
-        """Handle when an integer field value is changed."""
-        # Always add to config dictionary when spin box changes
-        self.config_values[field_name] = value
-        
-        # Update trash button state for this field
-        widget = self.get_field_widget(field_name)
-        if widget:
-            widget.update_trash_button_state(True)  # Field is now in config
-        
-        # Mark as modified
-        self.mark_as_modified()
+        """Handle when a field value is changed."""
+        kind = self.field_kinds.get(field_name)
+        if kind in ('bool', 'enum'):
+            # Buffer the change; toggles and selections arriving in the same
+            # event loop tick are applied together, after the emitting slot returns
+            if not self.flush_scheduled:
+                self.flush_scheduled = True
+                QTimer.singleShot(0, self.flush_pending_changes)
+            self.pending_changes[field_name] = value
+            return
+        if kind in ('string', 'struct'):
+            # Buffer the value until editing pauses. Anything that reads
+            # config_values or is_modified calls flush_pending_changes first.
+            self.pending_changes[field_name] = value
+            self.edit_timer.start()
+            return
         
-        # Schedule format update
-        self.schedule_format_update()
+        if field_name in self.config_values and self.config_values[field_name] == value:
+            return  # Already stored, nothing to update
         
-        debug_print(f"Set integer {field_name} = {value}")
-        debug_print(f"Current config has {len(self.config_values)} values")
-    
-    def on_string_value_changed(self, field_name: str, value):
-        """Handle when a string field value is changed."""
-        # Always add to config dictionary when text changes
+        # Always add to config dictionary when the value changes
         self.config_values[field_name] = value
         
         # Update trash button state for this field
@@ -2182,58 +2031,69 @@ int main() {
         # Schedule format update
         self.schedule_format_update()
         
-        value_str = f"[{', '.join(value)}]" if isinstance(value, list) else f'"{value}"'
-        debug_print(f"Set string {field_name} = {value_str}")
-        debug_print(f"Current config has {len(self.config_values)} values")
-    
-    def on_enum_value_changed(self, field_name: str, value: str):
-        """Handle when an enum field value is changed."""
-        # Always add to config dictionary when enum selection changes
-        self.config_values[field_name] = value
-        
-        # Update trash button state for this field
-        widget = self.get_field_widget(field_name)
-        if widget:
-            widget.update_trash_button_state(True)  # Field is now in config
-        
-        # Mark as modified
-        self.mark_as_modified()
-        
-        # Schedule format update
-        self.schedule_format_update()
+        logger.debug("Set %s %s = %s", kind, field_name, value)
+        logger.debug("Current config has %s values", len(self.config_values))
+    
+    def commit_focused_spin_box(self):
+        """Commit a number still being typed into the focused spin box.
+        
+        Spin boxes report typed numbers only on Enter or focus loss, and
+        shortcuts such as Ctrl+S keep the focus. Only call this where the
+        config is committed; mid-typing it would put back the previous value
+        of an empty or partial entry.
+        """
+        focus_widget = QApplication.focusWidget()
+        if isinstance(focus_widget, QAbstractSpinBox):
+            focus_widget.interpretText()
+    
+    def flush_pending_changes(self):
+        """Apply buffered field changes to the config dictionary."""
+        self.flush_scheduled = False
+        self.edit_timer.stop()  # The buffer is applied now, not when typing pauses
+        if not self.pending_changes:
+            return
         
-        debug_print(f"Set enum {field_name} = {value}")
-        debug_print(f"Current config has {len(self.config_values)} values")
-    
-    def on_struct_value_changed(self, field_name: str, struct_dict: dict):
-        """Handle when a struct field value is changed."""
-        # Add struct dict to config dictionary when any nested field changes
-        self.config_values[field_name] = struct_dict
+        # Local aliases keep attribute lookups out of the loop
+        config_values = self.config_values
+        get_widget = self.field_widgets.get
+        changed = False
+        for field_name, value in self.pending_changes.items():
+            if field_name in config_values and config_values[field_name] == value:
+                continue  # Changed back to the stored value
+            
+            if isinstance(value, dict):
+                # Struct widgets emit their live selected values; store a snapshot
+                value = copy.deepcopy(value)
+            config_values[field_name] = value
+            changed = True
+            logger.debug("Set %s %s = %s", self.field_kinds.get(field_name), field_name, value)
+            
+            # Update trash button state for this field
+            widget = get_widget(field_name)
+            if widget:
+                widget.update_trash_button_state(True)  # Field is now in config
         
-        # Update trash button state for this field
-        widget = self.get_field_widget(field_name)
-        if widget:
-            widget.update_trash_button_state(True)  # Field is now in config
+        self.pending_changes.clear()
+        if not changed:
+            return
+        logger.debug("Current config has %s values", len(self.config_values))
         
         # Mark as modified
         self.mark_as_modified()
         
         # Schedule format update
         self.schedule_format_update()
-        
-        debug_print(f"Set struct {field_name} = {struct_dict}")
-        debug_print(f"Current config has {len(self.config_values)} values")
     
     def on_field_value_removed(self, field_name: str):
         """Handle when a field value is removed."""
+        self.flush_pending_changes()
         if field_name in self.config_values:
             del self.config_values[field_name]
             
             # Update trash button state and reset checkbox for this field
             widget = self.get_field_widget(field_name)
             if widget:
-                widget.update_trash_button_state(False)  # Field no longer in config
-                widget.reset_to_default()  # Reset checkbox to unchecked (default state)
+                widget.apply_removed_state()  # Field no longer in config
             
             # Mark as modified
             self.mark_as_modified()
@@ -2241,18 +2101,18 @@ int main() {
             # Schedule format update
             self.schedule_format_update()
             
-            debug_print(f"Removed {field_name}")
-            debug_print(f"Current config has {len(self.config_values)} values")
+            logger.debug("Removed %s", field_name)
+            logger.debug("Current config has %s values", len(self.config_values))
     
     def get_field_widget(self, field_name: str):
         """Get the widget for a specific field name (returns BooleanFieldWidget, IntegerFieldWidget, StringFieldWidget, or EnumFieldWidget)."""
-        for widget in self.field_widgets:
-            if widget.field_name == field_name:
-                return widget
-        return None
+        return self.field_widgets.get(field_name)
     
     def new_file(self):
         """Create a new configuration file."""
+        # Apply edits still waiting in the buffer so they count as unsaved changes
+        self.commit_focused_spin_box()
+        self.flush_pending_changes()
         if self.is_modified:
             reply = QMessageBox.question(
                 self, 
@@ -2268,18 +2128,22 @@ int main() {
                 return
         
         # Clear current configuration
+        self.pending_changes.clear()
         self.config_values.clear()
         self.current_file_path = ""
         self.is_modified = False
         self.update_window_title()
         
         # Reset all field widgets to default state
-        for widget in self.field_widgets:
-            widget.reset_to_default()
-            widget.update_trash_button_state(False)
+        with self.bulk_update():
+            for widget in self.field_widgets.values():
+                widget.apply_removed_state()
     
     def open_file(self):
         """Open an existing .clang-format file."""
+        # Apply edits still waiting in the buffer so they count as unsaved changes
+        self.commit_focused_spin_box()
+        self.flush_pending_changes()
         if self.is_modified:
             reply = QMessageBox.question(
                 self,
@@ -2359,19 +2223,25 @@ int main() {
             yaml_content = {}
         
         # Clear current configuration
+        self.pending_changes.clear()
         self.config_values.clear()
         
-        # Reset all widgets first
-        for widget in self.field_widgets:
-            widget.reset_to_default()
-            widget.update_trash_button_state(False)
-        
-        # Apply loaded values to widgets
-        for key, value in yaml_content.items():
-            widget = self.get_field_widget(key)
-            if widget:
-                widget.set_value(value)
-                widget.update_trash_button_state(True)
+        with self.bulk_update():
+            # Reset all widgets first
+            for widget in self.field_widgets.values():
+                widget.apply_removed_state()
+            
+            # Apply loaded values to widgets; widgets that are not built yet pick
+            # their value up from config_values when they are created
+            for key, value in yaml_content.items():
+                if key not in self.field_kinds:
+                    continue
+                widget = self.get_field_widget(key)
+                if widget:
+                    # The values go straight into config_values, so do not echo them back
+                    with QSignalBlocker(widget):
+                        widget.set_value(value)
+                    widget.update_trash_button_state(True)
                 self.config_values[key] = value
         
         # Update file tracking
@@ -2382,10 +2252,13 @@ int main() {
         # Schedule format update
         self.schedule_format_update()
         
-        debug_print(f"Loaded {len(yaml_content)} configuration values from {file_path}")
+        logger.debug("Loaded %s configuration values from %s", len(yaml_content), file_path)
     
     def save_clang_format_file(self, file_path: str):
         """Save current configuration to a .clang-format YAML file."""
+        self.commit_focused_spin_box()
+        self.flush_pending_changes()
+        
         # Create YAML content from current config values
         yaml_content = dict(self.config_values)
         
@@ -2416,7 +2289,7 @@ int main() {
         self.is_modified = False
         self.update_window_title()
         
-        debug_print(f"Saved {len(yaml_content)} configuration values to {file_path}")
+        logger.debug("Saved %s configuration values to %s", len(yaml_content), file_path)
     
     def update_window_title(self):
         """Update the window title to show current file and modification status."""
@@ -2441,6 +2314,9 @@ int main() {
     
     def quit_application(self):
         """Handle application quit with unsaved changes check."""
+        # Apply edits still waiting in the buffer so they count as unsaved changes
+        self.commit_focused_spin_box()
+        self.flush_pending_changes()
         if self.is_modified and not self.is_quitting:
             self.is_quitting = True  # Set flag to prevent double dialog
             reply = QMessageBox.question(
@@ -2468,7 +2344,10 @@ int main() {
         if self.is_quitting:
             event.accept()
             return
-            
+        
+        # Apply edits still waiting in the buffer so they count as unsaved changes
+        self.commit_focused_spin_box()
+        self.flush_pending_changes()
         if self.is_modified:
             self.is_quitting = True  # Set flag to prevent recursion
             reply = QMessageBox.question(
@@ -2553,11 +2432,14 @@ int main() {
     
     def schedule_format_update(self):
         """Schedule a format update after a short delay to debounce rapid changes."""
-        self.format_timer.stop()  # Cancel any pending update
-        self.format_timer.start()  # Start new delay
+        # Restarting the single-shot timer drops any pending update, so a
+        # burst of edits (or a whole file load) formats the preview once
+        self.format_timer.start()
     
     def format_code_preview(self):
         """Format the sample C++ code using current configuration and update the preview."""
+        self.flush_pending_changes()
+        
         try:
             # Get current sample code
             sample_code = self.get_sample_code()
@@ -2608,7 +2490,7 @@ int main() {
                     # Error during formatting
                     error_msg = result.stderr or "Unknown formatting error"
                     self.update_format_status(f"⚠ Formatting error: {error_msg[:100]}")
-                    print(f"clang-format error: {error_msg}")
+                    logger.error("clang-format error: %s", error_msg)
                     
                     # Show original code with error annotation
                     error_annotation = f"// Formatting error: {error_msg}\n\n"
@@ -2616,17 +2498,17 @@ int main() {
                     
             except subprocess.TimeoutExpired:
                 self.update_format_status("⚠ Formatting timeout")
-                print("clang-format process timed out")
+                logger.error("clang-format process timed out")
                 self.code_editor.setPlainText("// Formatting timed out\n\n" + sample_code)
                 
             except FileNotFoundError:
                 self.update_format_status(f"⚠ clang-format not found: {self.clang_format_binary}")
-                print(f"clang-format binary not found: {self.clang_format_binary}")
+                logger.error("clang-format binary not found: %s", self.clang_format_binary)
                 self.code_editor.setPlainText(f"// clang-format not found: {self.clang_format_binary}\n\n" + sample_code)
                 
             except Exception as e:
                 self.update_format_status(f"⚠ Error: {str(e)[:50]}")
-                print(f"Unexpected error during formatting: {e}")
+                logger.error("Unexpected error during formatting: %s", e)
                 self.code_editor.setPlainText(f"// Error: {str(e)}\n\n" + sample_code)
             
             # Clean up temporary files
@@ -2634,15 +2516,15 @@ int main() {
                 Path(config_file_path).unlink()
                 Path(source_file_path).unlink()
             except Exception as e:
-                print(f"Warning: Could not clean up temporary files: {e}")
+                logger.warning("Could not clean up temporary files: %s", e)
                 
         except Exception as e:
-            print(f"Error in format_code_preview: {e}")
+            logger.error("Error in format_code_preview: %s", e)
             self.update_format_status(f"⚠ Preview error: {str(e)[:50]}")
     
     def update_format_status(self, message: str):
         """Update the formatting status in the UI."""
-        debug_print(f"Format status: {message}")
+        logger.debug("Format status: %s", message)
         
         # Update status label with appropriate styling
         if hasattr(self, 'format_status_label'):
@@ -2650,41 +2532,12 @@ int main() {
             
             # Style based on message type
             if message.startswith("✓"):
-                # Success
-                self.format_status_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 12px;
-                        color: #27ae60;
-                        padding: 5px 10px;
-                        background-color: #d5f4e6;
-                        border-radius: 3px;
-                        border: 1px solid #27ae60;
-                    }
-                """)
+                status = "success"
             elif message.startswith("⚠"):
-                # Warning/Error
-                self.format_status_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 12px;
-                        color: #e74c3c;
-                        padding: 5px 10px;
-                        background-color: #fdf2f2;
-                        border-radius: 3px;
-                        border: 1px solid #e74c3c;
-                    }
-                """)
+                status = "error"  # Warning/Error
             else:
-                # Default/Info
-                self.format_status_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 12px;
-                        color: #3498db;
-                        padding: 5px 10px;
-                        background-color: #ebf3fd;
-                        border-radius: 3px;
-                        border: 1px solid #3498db;
-                    }
-                """)
+                status = "info"
+            set_state_property(self.format_status_label, "status", status)
     
     def set_clang_format_binary(self, binary_path: str):
         """Set the path to the clang-format binary and trigger a format update."""
@@ -2708,16 +2561,22 @@ def main():
     )
     args = parser.parse_args()
     
-    # Set global verbose flag
-    global VERBOSE_MODE
-    VERBOSE_MODE = args.verbose
+    # Only configure logging on request so debug messages cost nothing by default
+    log_level = 'DEBUG' if args.verbose else os.environ.get('LOGLEVEL')
+    if log_level:
+        logging.basicConfig(level=log_level.upper(), format='%(message)s')
+    
+    # Merge queued mouse moves, resizes and similar events into one per pass;
+    # only the X11 platform enables this by default
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
     
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLESHEET)
     
     # Set application properties
-    app.setApplicationName("Clang-Format UI")
-    app.setApplicationVersion("1.0")
-    app.setOrganizationName("Development Tools")
+    app.setApplicationName(APP_NAME)
+    app.setApplicationVersion(APP_VERSION)
+    app.setOrganizationName(APP_ORGANIZATION)
     
     # Create and show main window
     window = ClangFormatUI(clang_format_binary=args.clang_format_binary)